@@ -357,6 +357,7 @@ async def _async_register_services(hass: HomeAssistant) -> None:
                         contract_id=coordinator.contract_id,
                         contract_name=coordinator.contract_name,
                         rate=coordinator.rate_with_option,
+                        uid=uid,
                     )
 
                     # Add UID to coordinator's tracked events
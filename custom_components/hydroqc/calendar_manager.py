@@ -5,11 +5,13 @@ from __future__ import annotations
 import asyncio
 import datetime
 import logging
+import re
 from typing import TYPE_CHECKING, Protocol
-from zoneinfo import ZoneInfo
 
 from homeassistant.components.calendar import CalendarEntity
 
+from .utils import TZ
+
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
@@ -38,6 +40,9 @@ DESCRIPTION_TEMPLATE = (
     "ID: {uid}"
 )
 
+# Matches the UID metadata line written by DESCRIPTION_TEMPLATE
+_UID_RE = re.compile(r"ID: (hydroqc_\S+)")
+
 # Delay between calendar event creation calls (seconds)
 EVENT_CREATION_DELAY = 0.1
 
@@ -62,6 +67,8 @@ async def async_create_peak_event(
     contract_id: str,
     contract_name: str,
     rate: str,
+    *,
+    uid: str | None = None,
 ) -> str:
     """Create a calendar event for a peak period.
 
@@ -72,6 +79,7 @@ async def async_create_peak_event(
         contract_id: Contract identifier for UID generation
         contract_name: Human-readable contract name for event title
         rate: Rate code (DPC or DCPC)
+        uid: Event UID already generated by the caller, if any
 
     Returns:
         The UID of the created event
@@ -79,8 +87,9 @@ async def async_create_peak_event(
     Raises:
         Exception: If calendar service call fails
     """
-    # Generate stable UID
-    uid = generate_event_uid(contract_id, peak_event.start_date)
+    # Generate stable UID unless the caller already did
+    if uid is None:
+        uid = generate_event_uid(contract_id, peak_event.start_date)
 
     # All events are critical peaks
     title = TITLE_CRITICAL
@@ -89,8 +98,7 @@ async def async_create_peak_event(
     start_str = peak_event.start_date.strftime("%H:%M")
     end_str = peak_event.end_date.strftime("%H:%M")
     # Use local timezone (America/Toronto) for creation timestamp
-    local_tz = ZoneInfo("America/Toronto")
-    created_at = datetime.datetime.now(local_tz).strftime("%Y-%m-%d %H:%M:%S %Z")
+    created_at = datetime.datetime.now(TZ).strftime("%Y-%m-%d %H:%M:%S %Z")
     critical_str = "Oui" if peak_event.is_critical else "Non"
 
     description = DESCRIPTION_TEMPLATE.format(
@@ -186,19 +194,13 @@ async def async_get_existing_event_uids(
         for event in events:
             description = event.description or ""
             # Extract UID from description (format: "ID: hydroqc_...")
-            if "ID: hydroqc_" in description:
-                # Find the UID in the description
-                uid_start = description.find("ID: hydroqc_")
-                if uid_start != -1:
-                    uid_line = description[uid_start:].split("\n")[0]
-                    uid = uid_line.replace("ID: ", "").strip()
-                    if uid.startswith("hydroqc_"):
-                        # Extract criticality (format: "Critique: Oui" or "Critique: Non")
-                        is_critical = "Critique: Oui" in description
-                        existing_events[uid] = is_critical
-                        _LOGGER.debug(
-                            "Found existing event with UID: %s (critical=%s)", uid, is_critical
-                        )
+            match = _UID_RE.search(description)
+            if match:
+                uid = match.group(1)
+                # Extract criticality (format: "Critique: Oui" or "Critique: Non")
+                is_critical = "Critique: Oui" in description
+                existing_events[uid] = is_critical
+                _LOGGER.debug("Found existing event with UID: %s (critical=%s)", uid, is_critical)
 
         _LOGGER.info("Found %d existing hydroqc events in calendar", len(existing_events))
 
@@ -268,38 +270,46 @@ async def async_sync_events(
     else:
         all_existing_uids = stored_uids
 
+    # Skip peaks whose event already exists in the calendar (avoid duplicates)
+    pending: list[tuple[PeakEventProtocol, str]] = []
+    for peak in future_peaks:
+        uid = generate_event_uid(contract_id, peak.start_date)
+        if uid in existing_events_info:
+            _LOGGER.debug("Event %s already exists, skipping", uid)
+        else:
+            pending.append((peak, uid))
+
+    new_uids = set(all_existing_uids)
+    if not pending:
+        _LOGGER.debug(
+            "All %d critical peaks already in calendar %s", len(future_peaks), calendar_id
+        )
+        return new_uids
+
     _LOGGER.info(
         "Syncing %d critical peak events to calendar %s",
-        len(future_peaks),
+        len(pending),
         calendar_id,
     )
 
-    # Create events sequentially with delay (skip duplicates)
-    new_uids = set(all_existing_uids)
+    # Create events sequentially with delay
     events_created = 0
 
-    for peak in future_peaks:
-        uid = generate_event_uid(contract_id, peak.start_date)
-
-        # Skip if event already exists (avoid duplicates)
-        if uid in existing_events_info:
-            _LOGGER.debug("Event %s already exists, skipping", uid)
-            continue
-
+    for peak, uid in pending:
         # Recreate if tracked but not in calendar
-        if uid in stored_uids and uid not in existing_events_info:
+        if uid in stored_uids:
             _LOGGER.debug("Event %s tracked but not in calendar, recreating", uid)
 
         try:
             # Create event
             created_uid = await async_create_peak_event(
-                hass, calendar_id, peak, contract_id, contract_name, rate
+                hass, calendar_id, peak, contract_id, contract_name, rate, uid=uid
             )
             new_uids.add(created_uid)
             events_created += 1
 
             # Delay before next creation
-            if peak != future_peaks[-1]:  # Skip delay after last event
+            if peak != pending[-1][0]:  # Skip delay after last event
                 await asyncio.sleep(EVENT_CREATION_DELAY)
 
         except Exception as err:
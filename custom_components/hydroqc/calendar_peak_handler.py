@@ -196,7 +196,7 @@ class CalendarPeakHandler:
                 _LOGGER.debug(
                     "[Calendar] DCPC: %d critical (calendar) + %d non-critical (generated) = %d total",
                     len(critical_events),
-                    len([e for e in self._events if not e.is_critical]),
+                    sum(not e.is_critical for e in self._events),
                     len(self._events),
                 )
             else:
@@ -3,16 +3,42 @@
 from __future__ import annotations
 
 import datetime
+import functools
 import logging
 import zoneinfo
+from collections.abc import Mapping
 from typing import Any
 
 _LOGGER = logging.getLogger(__name__)
 
+# Anchor periods: (offset before peak start, duration) for morning and evening peaks
+_MORNING_ANCHOR_OFFSET = datetime.timedelta(hours=5)
+_MORNING_ANCHOR_DURATION = datetime.timedelta(hours=3)
+_EVENING_ANCHOR_OFFSET = datetime.timedelta(hours=4)
+_EVENING_ANCHOR_DURATION = datetime.timedelta(hours=2)
+
+# API dates are ~25 characters; longer strings are parsed without caching
+_ISO_CACHE_MAX_LEN = 40
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_fromisoformat(value: str) -> datetime.datetime:
+    """Parse an ISO date string, memoized since the API repeats the same dates."""
+    return datetime.datetime.fromisoformat(value)
+
+
+def _parse_iso(value: str) -> datetime.datetime:
+    """Parse an ISO date string, caching only short API-sized inputs."""
+    if len(value) < _ISO_CACHE_MAX_LEN:
+        return _cached_fromisoformat(value)
+    return datetime.datetime.fromisoformat(value)
+
 
 class PreHeatPeriod:
     """Represents a pre-heat period before a peak."""
 
+    __slots__ = ("end_date", "start_date")
+
     def __init__(self, peak_start: datetime.datetime, duration_minutes: int) -> None:
         """Initialize pre-heat period."""
         self.start_date = peak_start - datetime.timedelta(minutes=duration_minutes)
@@ -22,6 +48,8 @@ class PreHeatPeriod:
 class AnchorPeriod:
     """Represents an anchor period (notification) before a peak."""
 
+    __slots__ = ("end_date", "is_critical", "start_date")
+
     def __init__(self, peak_start: datetime.datetime, is_morning: bool, is_critical: bool) -> None:
         """Initialize anchor period.
 
@@ -30,24 +58,37 @@ class AnchorPeriod:
         """
         if is_morning:
             # Morning: 5 hours before peak, duration 3 hours
-            anchor_start_offset = 5
-            anchor_duration = 3
+            anchor_start_offset = _MORNING_ANCHOR_OFFSET
+            anchor_duration = _MORNING_ANCHOR_DURATION
         else:
             # Evening: 4 hours before peak, duration 2 hours
-            anchor_start_offset = 4
-            anchor_duration = 2
+            anchor_start_offset = _EVENING_ANCHOR_OFFSET
+            anchor_duration = _EVENING_ANCHOR_DURATION
 
-        self.start_date = peak_start - datetime.timedelta(hours=anchor_start_offset)
-        self.end_date = self.start_date + datetime.timedelta(hours=anchor_duration)
+        self.start_date = peak_start - anchor_start_offset
+        self.end_date = self.start_date + anchor_duration
         self.is_critical = is_critical
 
 
 class PeakEvent:
     """Represents a winter peak event."""
 
+    # Many events are built per refresh and read often; no per-instance __dict__
+    __slots__ = (
+        "_anchor",
+        "_force_critical",
+        "_preheat_duration",
+        "duration",
+        "end_date",
+        "offer",
+        "sector",
+        "start_date",
+        "time_slot",
+    )
+
     def __init__(
         self,
-        data: dict[str, Any],
+        data: Mapping[str, Any],
         preheat_duration: int = 120,
         force_critical: bool | None = None,
     ) -> None:
@@ -65,34 +106,61 @@ class PeakEvent:
         tz = zoneinfo.ZoneInfo("America/Toronto")
 
         # API uses lowercase field names: datedebut, datefin, plagehoraire, secteurclient
-        start_str = data.get("datedebut") or data.get("dateDebut")
-        end_str = data.get("datefin") or data.get("dateFin")
+        start_value = data.get("datedebut") or data.get("dateDebut")
+        end_value = data.get("datefin") or data.get("dateFin")
 
-        if not start_str or not end_str:
+        if not start_value or not end_value:
             raise ValueError(f"Missing date fields in data: {data}")
 
-        # Handle both date formats:
-        # - Simple: "YYYY-MM-DD HH:MM" (most common from API)
-        # - ISO: "YYYY-MM-DDTHH:MM:SS-05:00" or similar
+        if isinstance(start_value, datetime.datetime) and isinstance(end_value, datetime.datetime):
+            # Already parsed (generated schedule), no string round-trip needed
+            self.start_date = start_value if start_value.tzinfo else start_value.replace(tzinfo=tz)
+            self.end_date = end_value if end_value.tzinfo else end_value.replace(tzinfo=tz)
+        else:
+            self.start_date, self.end_date = self._parse_dates(start_value, end_value, tz)
+
+        self.time_slot = data.get("plagehoraire") or data.get("plageHoraire")  # AM or PM
+        self.duration = data.get("duree")
+        self.sector = data.get("secteurclient") or data.get(
+            "secteurClient"
+        )  # Résidentiel or Affaires
+        self._preheat_duration = preheat_duration
+        self._anchor: AnchorPeriod | None = None
+
+    @staticmethod
+    def _parse_dates(
+        start_str: str, end_str: str, tz: zoneinfo.ZoneInfo
+    ) -> tuple[datetime.datetime, datetime.datetime]:
+        """Parse API start/end date strings into timezone-aware datetimes.
+
+        Handles both date formats:
+        - Simple: "YYYY-MM-DD HH:MM" (most common from API)
+        - ISO: "YYYY-MM-DDTHH:MM:SS-05:00" or similar
+
+        Args:
+            start_str: Start date string from API
+            end_str: End date string from API
+            tz: Timezone applied to naive dates
+
+        Returns:
+            Tuple of (start_date, end_date)
+        """
         try:
             # Try ISO format first
-            start_dt = datetime.datetime.fromisoformat(start_str)
-            end_dt = datetime.datetime.fromisoformat(end_str)
+            start_dt = _parse_iso(start_str)
+            end_dt = _parse_iso(end_str)
             # Ensure timezone-aware - if naive, add America/Toronto
             if start_dt.tzinfo is None:
                 start_dt = start_dt.replace(tzinfo=tz)
             if end_dt.tzinfo is None:
                 end_dt = end_dt.replace(tzinfo=tz)
-            self.start_date = start_dt
-            self.end_date = end_dt
+            return start_dt, end_dt
         except (ValueError, TypeError) as err:
             # Fall back to simple format
             try:
-                self.start_date = datetime.datetime.strptime(start_str, "%Y-%m-%d %H:%M").replace(
-                    tzinfo=tz
-                )
-                self.end_date = datetime.datetime.strptime(end_str, "%Y-%m-%d %H:%M").replace(
-                    tzinfo=tz
+                return (
+                    datetime.datetime.strptime(start_str, "%Y-%m-%d %H:%M").replace(tzinfo=tz),
+                    datetime.datetime.strptime(end_str, "%Y-%m-%d %H:%M").replace(tzinfo=tz),
                 )
             except (ValueError, TypeError) as err2:
                 _LOGGER.error(
@@ -104,13 +172,6 @@ class PeakEvent:
                 )
                 raise
 
-        self.time_slot = data.get("plagehoraire") or data.get("plageHoraire")  # AM or PM
-        self.duration = data.get("duree")
-        self.sector = data.get("secteurclient") or data.get(
-            "secteurClient"
-        )  # Résidentiel or Affaires
-        self._preheat_duration = preheat_duration
-
     @property
     def is_critical(self) -> bool:
         """Determine if this is a critical peak.
@@ -135,10 +196,16 @@ class PeakEvent:
 
     @property
     def anchor(self) -> AnchorPeriod:
-        """Get anchor period for this peak (Winter Credits)."""
-        # Determine if this is a morning peak (6:00-10:00) or evening peak (16:00-20:00)
-        is_morning = self.time_slot == "AM"
-        return AnchorPeriod(self.start_date, is_morning, self.is_critical)
+        """Get anchor period for this peak (Winter Credits).
+
+        Built on first access and reused: the peak's start, slot and critical
+        status do not change after construction.
+        """
+        if self._anchor is None:
+            # Determine if this is a morning peak (6:00-10:00) or evening peak (16:00-20:00)
+            is_morning = self.time_slot == "AM"
+            self._anchor = AnchorPeriod(self.start_date, is_morning, self.is_critical)
+        return self._anchor
 
     @property
     def is_residential(self) -> bool:
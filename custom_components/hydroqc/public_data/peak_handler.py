@@ -4,10 +4,10 @@ from __future__ import annotations
 
 import datetime
 import logging
-import zoneinfo
+from collections.abc import Mapping, Sequence
 from typing import Any
 
-from ..utils import get_winter_season_bounds, is_winter_season
+from ..utils import TZ, get_winter_season_bounds, is_winter_season
 from .models import AnchorPeriod, PeakEvent
 
 _LOGGER = logging.getLogger(__name__)
@@ -23,6 +23,21 @@ RATE_CODE_MAPPING = {
     "OEA": "M-OEA",  # Commercial OEA
 }
 
+# Winter Credits (DCPC) fixed daily peak schedule, local time
+_MORNING_PEAK_START = datetime.time(6, 0)
+_MORNING_PEAK_END = datetime.time(10, 0)
+_EVENING_PEAK_START = datetime.time(16, 0)
+_EVENING_PEAK_END = datetime.time(20, 0)
+
+
+def _now() -> datetime.datetime:
+    """Get the current time in America/Toronto.
+
+    All time-dependent PeakHandler logic reads the clock through this function,
+    so tests can pin it with monkeypatch instead of freezing datetime globally.
+    """
+    return datetime.datetime.now(TZ)
+
 
 class PeakHandler:
     """Handles peak event logic and calculations."""
@@ -37,25 +52,51 @@ class PeakHandler:
         self.rate_code = rate_code
         self.preheat_duration = preheat_duration
         self._events: list[PeakEvent] = []
+        # Today/tomorrow peak lookups keyed by (local date, day offset, start hour)
+        self._period_peaks: dict[tuple[datetime.date, int, int], PeakEvent | None] = {}
+        # First (earliest) event per (local date, time slot), rebuilt in load_events
+        self._by_day_slot: dict[tuple[datetime.date, str | None], PeakEvent] = {}
 
-    def load_events(self, events: list[dict[str, Any]]) -> None:
+    def load_events(self, events: Sequence[Mapping[str, Any]]) -> None:
         """Load peak events from API and generate schedule if needed.
 
         For DCPC (Winter Credits):
         - Generates daily schedule (today + tomorrow)
+        - Without API events, uses the generated schedule as-is
         - Marks API events as critical (force_critical=True)
         - Marks generated schedule as non-critical (force_critical=False)
         - If API event matches generated peak (same date+timeslot), uses API version
 
         For DPC and other rates:
         - Only uses API events (all marked as critical)
+
+        Without API events, returns early with no events unless a DCPC
+        schedule must be generated (DCPC during winter).
         """
+        # Cached period lookups refer to the previous events
+        self._period_peaks.clear()
+
+        if not events and (self.rate_code != "DCPC" or not is_winter_season(_now())):
+            # Nothing announced and no schedule to generate: nothing to parse or index
+            self._events = []
+            self._by_day_slot = {}
+            _LOGGER.debug("[OpenData] No API events and no schedule for rate %s", self.rate_code)
+            return
+
         # Create API events with force_critical=True (all API announcements are critical)
         api_events = [
             PeakEvent(event, self.preheat_duration, force_critical=True) for event in events
         ]
 
-        if self.rate_code == "DCPC":
+        if self.rate_code == "DCPC" and not api_events:
+            # No announced critical peaks (most days): the generated schedule is
+            # already in chronological order, nothing to merge or sort
+            self._events = self._generate_dcpc_schedule()
+            _LOGGER.debug(
+                "[OpenData] DCPC schedule: no API events, %d generated (non-critical)",
+                len(self._events),
+            )
+        elif self.rate_code == "DCPC":
             # Generate schedule for DCPC
             generated_peaks = self._generate_dcpc_schedule()
 
@@ -89,24 +130,18 @@ class PeakHandler:
             _LOGGER.debug(
                 "[OpenData] DCPC schedule: %d API events (critical) + %d generated (non-critical) = %d total",
                 len(api_events),
-                len(generated_peaks)
-                - len(
-                    [
-                        p
-                        for p in generated_peaks
-                        if (p.start_date.date(), p.time_slot) in api_dates_slots
-                    ]
-                ),
+                # Merged events are the API events plus the unmatched generated peaks
+                len(self._events) - len(api_events),
                 len(self._events),
             )
         else:
-            # For DPC and other rates, only use API events
-            self._events = api_events
+            # For DPC and other rates, only use API events, sorted by start date
+            self._events = sorted(api_events, key=lambda e: e.start_date)
 
             # Log critical peak date range for debugging
             if self._events:
-                first_peak = min(self._events, key=lambda e: e.start_date)
-                last_peak = max(self._events, key=lambda e: e.start_date)
+                first_peak = self._events[0]
+                last_peak = self._events[-1]
                 _LOGGER.debug(
                     "[OpenData] %s peaks: first=%s, last=%s, total=%d (all critical)",
                     self.rate_code,
@@ -121,6 +156,11 @@ class PeakHandler:
                     self.rate_code,
                 )
 
+        # Index by local date and time slot for the today/tomorrow lookups
+        self._by_day_slot = {}
+        for event in self._events:
+            self._by_day_slot.setdefault((event.start_date.date(), event.time_slot), event)
+
     def _generate_dcpc_schedule(self) -> list[PeakEvent]:
         """Generate DCPC (Winter Credits) peak schedule for today and tomorrow.
 
@@ -131,8 +171,7 @@ class PeakHandler:
         Returns empty list if outside winter season.
         Returns list of PeakEvent objects with force_critical=False.
         """
-        tz = zoneinfo.ZoneInfo("America/Toronto")
-        now = datetime.datetime.now(tz)
+        now = _now()
         today = now.date()
 
         # Check if we're in winter season (Dec 1 - Mar 31)
@@ -153,13 +192,13 @@ class PeakHandler:
             target_date = today + datetime.timedelta(days=day_offset)
 
             # Morning peak: 6:00-10:00
-            morning_start = datetime.datetime.combine(target_date, datetime.time(6, 0), tzinfo=tz)
-            morning_end = datetime.datetime.combine(target_date, datetime.time(10, 0), tzinfo=tz)
+            morning_start = datetime.datetime.combine(target_date, _MORNING_PEAK_START, tzinfo=TZ)
+            morning_end = datetime.datetime.combine(target_date, _MORNING_PEAK_END, tzinfo=TZ)
 
             morning_data = {
                 "offre": "CPC-D",
-                "datedebut": morning_start.isoformat(),
-                "datefin": morning_end.isoformat(),
+                "datedebut": morning_start,
+                "datefin": morning_end,
                 "plagehoraire": "AM",
                 "duree": "PT04H00MS",
                 "secteurclient": "Résidentiel",
@@ -169,13 +208,13 @@ class PeakHandler:
             )
 
             # Evening peak: 16:00-20:00
-            evening_start = datetime.datetime.combine(target_date, datetime.time(16, 0), tzinfo=tz)
-            evening_end = datetime.datetime.combine(target_date, datetime.time(20, 0), tzinfo=tz)
+            evening_start = datetime.datetime.combine(target_date, _EVENING_PEAK_START, tzinfo=TZ)
+            evening_end = datetime.datetime.combine(target_date, _EVENING_PEAK_END, tzinfo=TZ)
 
             evening_data = {
                 "offre": "CPC-D",
-                "datedebut": evening_start.isoformat(),
-                "datefin": evening_end.isoformat(),
+                "datedebut": evening_start,
+                "datefin": evening_end,
                 "plagehoraire": "PM",
                 "duree": "PT04H00MS",
                 "secteurclient": "Résidentiel",
@@ -212,9 +251,10 @@ class PeakHandler:
     @property
     def next_peak(self) -> PeakEvent | None:
         """Get next upcoming peak event."""
+        return self._next_peak_at(_now())
 
-        tz = zoneinfo.ZoneInfo("America/Toronto")
-        now = datetime.datetime.now(tz)
+    def _next_peak_at(self, now: datetime.datetime) -> PeakEvent | None:
+        """Get the next peak that has not ended at the given time."""
         # Filter upcoming events - all event dates are already timezone-aware
         upcoming = [e for e in self._events if e.end_date > now]
         return min(upcoming, key=lambda e: e.start_date, default=None) if upcoming else None
@@ -222,9 +262,7 @@ class PeakHandler:
     @property
     def next_critical_peak(self) -> PeakEvent | None:
         """Get next critical peak event."""
-
-        tz = zoneinfo.ZoneInfo("America/Toronto")
-        now = datetime.datetime.now(tz)
+        now = _now()
         # Filter upcoming critical events - all event dates are already timezone-aware
         upcoming = [e for e in self._events if e.end_date > now and e.is_critical]
         return min(upcoming, key=lambda e: e.start_date, default=None) if upcoming else None
@@ -232,9 +270,10 @@ class PeakHandler:
     @property
     def current_peak(self) -> PeakEvent | None:
         """Get current active peak if any."""
+        return self._current_peak_at(_now())
 
-        tz = zoneinfo.ZoneInfo("America/Toronto")
-        now = datetime.datetime.now(tz)
+    def _current_peak_at(self, now: datetime.datetime) -> PeakEvent | None:
+        """Get the peak in progress at the given time, if any."""
         # Check if we're within any event's time window - all event dates are timezone-aware
         for event in self._events:
             if event.start_date <= now <= event.end_date:
@@ -253,15 +292,14 @@ class PeakHandler:
         - "anchor": During an anchor period before a non-critical peak (DCPC only)
         - "normal": Regular period (no peak/anchor/preheat active)
         """
-        tz = zoneinfo.ZoneInfo("America/Toronto")
-        now = datetime.datetime.now(tz)
+        now = _now()
 
         # If we're not in the dec 1st. to mar 31st. period, we're off-season
-        if not ((now.month, now.day) >= (12, 1) or (now.month, now.day) <= (3, 31)):
+        if not is_winter_season(now):
             return "off_season"
 
-        # Check if currently in a peak
-        current = self.current_peak
+        # Check if currently in a peak (reusing the same "now")
+        current = self._current_peak_at(now)
         if current:
             return "critical_peak" if current.is_critical else "peak"
 
@@ -285,10 +323,8 @@ class PeakHandler:
     @property
     def preheat_in_progress(self) -> bool:
         """Check if pre-heat is in progress."""
-
-        tz = zoneinfo.ZoneInfo("America/Toronto")
-        now = datetime.datetime.now(tz)
-        next_event = self.next_peak
+        now = _now()
+        next_event = self._next_peak_at(now)
         if not next_event:
             return False
 
@@ -310,54 +346,61 @@ class PeakHandler:
 
         # Ensure period_start is timezone-aware in America/Toronto
         if period_start.tzinfo is None:
-            tz = zoneinfo.ZoneInfo("America/Toronto")
-            period_start = period_start.replace(tzinfo=tz)
-        elif period_start.tzinfo != zoneinfo.ZoneInfo("America/Toronto"):
+            period_start = period_start.replace(tzinfo=TZ)
+        elif period_start.tzinfo != TZ:
             # Convert to America/Toronto if it's a different timezone
-            period_start = period_start.astimezone(zoneinfo.ZoneInfo("America/Toronto"))
+            period_start = period_start.astimezone(TZ)
 
         for event in self._events:
             if event.start_date <= period_start < event.end_date:
                 return event
         return None
 
+    def _get_cached_peak(self, day_offset: int, hour: int) -> PeakEvent | None:
+        """Get the peak starting at the given hour today or tomorrow.
+
+        The lookup only depends on the loaded events and the local date, so the
+        result is reused until the date changes or new events are loaded.
+
+        Args:
+            day_offset: 0 for today, 1 for tomorrow
+            hour: Local hour the period starts at
+
+        Returns:
+            The matching peak event, or None if there is none
+        """
+        now = _now()
+        key = (now.date(), day_offset, hour)
+        if key not in self._period_peaks:
+            day = now + datetime.timedelta(days=day_offset)
+            period_start = day.replace(hour=hour, minute=0, second=0, microsecond=0)
+            indexed = self._by_day_slot.get((period_start.date(), "AM" if hour < 12 else "PM"))
+            if indexed is not None and indexed.start_date <= period_start < indexed.end_date:
+                self._period_peaks[key] = indexed
+            else:
+                # Events with unusual bounds or slots still go through the full scan
+                self._period_peaks[key] = self._get_peak_for_period(period_start)
+        return self._period_peaks[key]
+
     @property
     def today_morning_peak(self) -> PeakEvent | None:
         """Get today's morning peak (6AM-12PM)."""
-
-        tz = zoneinfo.ZoneInfo("America/Toronto")
-        now = datetime.datetime.now(tz)
-        morning_start = now.replace(hour=6, minute=0, second=0, microsecond=0)
-        return self._get_peak_for_period(morning_start)
+        return self._get_cached_peak(day_offset=0, hour=_MORNING_PEAK_START.hour)
 
     @property
     def today_evening_peak(self) -> PeakEvent | None:
         """Get today's evening peak (4PM-8PM)."""
-
-        tz = zoneinfo.ZoneInfo("America/Toronto")
-        now = datetime.datetime.now(tz)
-        evening_start = now.replace(hour=16, minute=0, second=0, microsecond=0)
-        return self._get_peak_for_period(evening_start)
+        return self._get_cached_peak(day_offset=0, hour=_EVENING_PEAK_START.hour)
 
     @property
     def tomorrow_morning_peak(self) -> PeakEvent | None:
         """Get tomorrow's morning peak (6AM-12PM)."""
-
-        tz = zoneinfo.ZoneInfo("America/Toronto")
-        now = datetime.datetime.now(tz)
-        tomorrow = now + datetime.timedelta(days=1)
-        morning_start = tomorrow.replace(hour=6, minute=0, second=0, microsecond=0)
-        return self._get_peak_for_period(morning_start)
+        return self._get_cached_peak(day_offset=1, hour=_MORNING_PEAK_START.hour)
 
     @property
     def tomorrow_evening_peak(self) -> PeakEvent | None:
         """Get tomorrow's evening peak (4PM-8PM)."""
-
-        tz = zoneinfo.ZoneInfo("America/Toronto")
-        now = datetime.datetime.now(tz)
-        tomorrow = now + datetime.timedelta(days=1)
-        evening_start = tomorrow.replace(hour=16, minute=0, second=0, microsecond=0)
-        return self._get_peak_for_period(evening_start)
+        return self._get_cached_peak(day_offset=1, hour=_EVENING_PEAK_START.hour)
 
     @property
     def next_anchor(self) -> AnchorPeriod | None:
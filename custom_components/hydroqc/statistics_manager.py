@@ -15,6 +15,8 @@ from homeassistant.helpers.update_coordinator import UpdateFailed
 
 from hydroqc.error import HydroQcHTTPError
 
+from .utils import TZ
+
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
@@ -22,6 +24,9 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Hourly API payload keys for each consumption type
+_CONSUMPTION_KEYS = {"total": "consoTotal", "reg": "consoReg", "haut": "consoHaut"}
+
 
 class StatisticsManager:
     """Manages statistics queries and hourly consumption imports."""
@@ -71,17 +76,17 @@ class StatisticsManager:
         """
         try:
             # Check last 30 days for existing statistics
-            today = datetime.date.today()
+            # Use the Toronto date so "today" matches the statistics timeline
+            today = datetime.datetime.now(TZ).date()
             thirty_days_ago = today - datetime.timedelta(days=30)
-            tz = zoneinfo.ZoneInfo("America/Toronto")
 
             statistic_id = self._get_statistic_id("total")
 
             all_stats = await get_instance(self.hass).async_add_executor_job(
                 statistics.statistics_during_period,
                 self.hass,
-                datetime.datetime.combine(thirty_days_ago, datetime.time.min).replace(tzinfo=tz),
-                datetime.datetime.combine(today, datetime.time.max).replace(tzinfo=tz),
+                datetime.datetime.combine(thirty_days_ago, datetime.time.min, tzinfo=TZ),
+                datetime.datetime.combine(today, datetime.time.max, tzinfo=TZ),
                 {statistic_id},
                 "hour",
                 None,
@@ -223,7 +228,6 @@ class StatisticsManager:
             # Determine consumption types based on rate
             consumption_types = self._get_consumption_types()
 
-            tz = zoneinfo.ZoneInfo("America/Toronto")
             current_date = start_date
 
             # Fetch and import data for each day in range
@@ -245,7 +249,7 @@ class StatisticsManager:
                         current_date,
                         hourly_list,  # type: ignore[arg-type]
                         consumption_types,
-                        tz,
+                        TZ,
                     )
 
                     current_date += datetime.timedelta(days=1)
@@ -333,17 +337,12 @@ class StatisticsManager:
             Last cumulative sum, or 0.0 if no previous statistics found
         """
         statistic_id = self._get_statistic_id(consumption_type)
-        tz = zoneinfo.ZoneInfo("America/Toronto")
 
         # Try to find last stat, looking back up to 30 days
         for i in range(30):
             current_date = reference_date - datetime.timedelta(days=i)
-            start_datetime = datetime.datetime.combine(current_date, datetime.time.min).replace(
-                tzinfo=tz
-            )
-            end_datetime = datetime.datetime.combine(current_date, datetime.time.max).replace(
-                tzinfo=tz
-            )
+            start_datetime = datetime.datetime.combine(current_date, datetime.time.min, tzinfo=TZ)
+            end_datetime = datetime.datetime.combine(current_date, datetime.time.max, tzinfo=TZ)
 
             try:
                 last_stats = await get_instance(self.hass).async_add_executor_job(
@@ -407,6 +406,7 @@ class StatisticsManager:
             # Build statistics list for today
             stats_list = []
             cumulative_sum = base_sum
+            consumption_key = _CONSUMPTION_KEYS[consumption_type]
 
             for hour_data in hourly_list:
                 # Parse hour time (format: "HH:MM:SS")
@@ -419,7 +419,6 @@ class StatisticsManager:
                 hour_datetime_tz = hour_datetime.replace(tzinfo=tz)
 
                 # Get consumption value for this type
-                consumption_key = f"conso{consumption_type.capitalize()}"
                 consumption_kwh = hour_data.get(consumption_key, 0.0)
 
                 # Update cumulative sum
@@ -23,15 +23,11 @@ def is_winter_season(dt: datetime.datetime | datetime.date | None = None) -> boo
     if dt is None:
         dt = datetime.datetime.now(TZ)
 
-    if isinstance(dt, datetime.datetime):
-        month, day = dt.month, dt.day
-    else:
-        month, day = dt.month, dt.day
-
     # Winter season: Dec 1 to Mar 31
     # (month, day) >= (12, 1) covers Dec 1 to Dec 31
     # (month, day) <= (3, 31) covers Jan 1 to Mar 31
-    return (month, day) >= (12, 1) or (month, day) <= (3, 31)
+    month_day = (dt.month, dt.day)
+    return month_day >= (12, 1) or month_day <= (3, 31)
 
 
 def get_winter_season_bounds(
@@ -10,16 +10,25 @@ except ImportError:
     print("❌ PyYAML not installed. Run: pip install pyyaml")
     sys.exit(1)
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _BaseLoader
+except ImportError:
+    _BaseLoader = yaml.SafeLoader
+
+# Home Assistant specific tags used in blueprints
+HA_TAGS = ("!input", "!include", "!secret", "!env_var")
+
 
 # Custom YAML loader that handles Home Assistant tags
-class HomeAssistantLoader(yaml.SafeLoader):
+class HomeAssistantLoader(_BaseLoader):
     """YAML loader that supports Home Assistant specific tags."""
 
     pass
 
 
 # Add constructors for Home Assistant tags
-def ha_tag_constructor(loader, tag_suffix, node):
+def ha_tag_constructor(loader, node):
     """Constructor for HA tags like !input, !include, etc."""
     if isinstance(node, yaml.ScalarNode):
         return loader.construct_scalar(node)
@@ -31,7 +40,8 @@ def ha_tag_constructor(loader, tag_suffix, node):
 
 
 # Register Home Assistant tags
-HomeAssistantLoader.add_multi_constructor("!", ha_tag_constructor)
+for _tag in HA_TAGS:
+    HomeAssistantLoader.add_constructor(_tag, ha_tag_constructor)
 
 
 def validate_blueprint(blueprint_path: Path) -> bool:
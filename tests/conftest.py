@@ -1,7 +1,9 @@
 """Fixtures for Hydro-Québec integration tests."""
 
 from collections.abc import Generator
-from datetime import datetime
+from datetime import date, datetime
+from itertools import accumulate
+from types import SimpleNamespace
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 from zoneinfo import ZoneInfo
@@ -13,10 +15,16 @@ from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+from custom_components.hydroqc import (
+    binary_sensor as binary_sensor_module,
+    sensor as sensor_module,
+)
 from custom_components.hydroqc.const import (
+    AUTH_MODE_OPENDATA,
     AUTH_MODE_PORTAL,
     CONF_ACCOUNT_ID,
     CONF_AUTH_MODE,
+    CONF_CALENDAR_ENTITY_ID,
     CONF_CONTRACT_ID,
     CONF_CONTRACT_NAME,
     CONF_CUSTOMER_ID,
@@ -29,6 +37,151 @@ from custom_components.hydroqc.const import (
 # Timezone for all date/time operations
 EST_TIMEZONE = ZoneInfo("America/Toronto")
 
+# Config entry data templates (ConfigEntry wraps data read-only, so sharing is safe)
+_PORTAL_DATA: dict[str, Any] = {
+    CONF_AUTH_MODE: AUTH_MODE_PORTAL,
+    CONF_USERNAME: "test@example.com",
+    CONF_PASSWORD: "test_password",
+    CONF_CUSTOMER_ID: "test_customer_id",
+    CONF_ACCOUNT_ID: "test_account_id",
+    CONF_CONTRACT_ID: "contract123",
+    CONF_CONTRACT_NAME: "Home",
+    CONF_RATE: "D",
+    CONF_RATE_OPTION: "",
+    CONF_PREHEAT_DURATION: 120,
+}
+_OPENDATA_DATA: dict[str, Any] = {
+    CONF_AUTH_MODE: AUTH_MODE_OPENDATA,
+    CONF_RATE: "DPC",
+    CONF_RATE_OPTION: "",
+    CONF_PREHEAT_DURATION: 120,
+}
+_OPENDATA_DCPC_DATA: dict[str, Any] = {
+    CONF_AUTH_MODE: AUTH_MODE_OPENDATA,
+    CONF_RATE: "D",
+    CONF_RATE_OPTION: "CPC",
+    CONF_PREHEAT_DURATION: 120,
+}
+
+# Shared dates and timestamps used by the mock fixtures
+_CP_START_DATE = date(2024, 11, 1)
+_CP_END_DATE = date(2024, 11, 30)
+_DPC_NEXT_EVENT = datetime(2024, 12, 15, 13, 0, tzinfo=EST_TIMEZONE)
+_DCPC_NEXT_EVENT = datetime(2024, 12, 10, 17, 0, tzinfo=EST_TIMEZONE)
+_TODAY_AM_START = datetime(2024, 12, 15, 6, 0, tzinfo=EST_TIMEZONE)
+_TODAY_AM_END = datetime(2024, 12, 15, 10, 0, tzinfo=EST_TIMEZONE)
+_TODAY_PM_START = datetime(2024, 12, 15, 16, 0, tzinfo=EST_TIMEZONE)
+_TODAY_PM_END = datetime(2024, 12, 15, 20, 0, tzinfo=EST_TIMEZONE)
+
+# Hourly consumption API payloads shared by the mock contracts
+_EMPTY_HOURLY: dict[str, Any] = {"results": {"listeDonneesConsoEnergieHoraire": []}}
+_ONE_POINT_HOURLY: dict[str, Any] = {
+    "results": {
+        "listeDonneesConsoEnergieHoraire": [
+            {"dateHeureDebutPeriode": "2024-11-26 00:00", "consoReg": 1.234},
+        ]
+    }
+}
+_TWO_POINT_HOURLY: dict[str, Any] = {
+    "results": {
+        "listeDonneesConsoEnergieHoraire": [
+            {"dateHeureDebutPeriode": "2024-11-26 00:00", "consoReg": 1.234},
+            {"dateHeureDebutPeriode": "2024-11-26 01:00", "consoReg": 1.567},
+        ]
+    }
+}
+_SAMPLE_HOURLY_JSON: dict[str, Any] = {
+    "results": {
+        "listeDonneesConsoEnergieHoraire": [
+            {
+                "dateHeureDebutPeriode": "2024-11-26 00:00",
+                "consoReg": 1.234,
+                "consoHaut": None,
+                "consoTotal": 1.234,
+            },
+            {
+                "dateHeureDebutPeriode": "2024-11-26 01:00",
+                "consoReg": 1.567,
+                "consoHaut": None,
+                "consoTotal": 1.567,
+            },
+            {
+                "dateHeureDebutPeriode": "2024-11-26 02:00",
+                "consoReg": 1.890,
+                "consoHaut": None,
+                "consoTotal": 1.890,
+            },
+        ]
+    }
+}
+_SAMPLE_CSV = """Date,Heure début,Heure fin,Consommation (kWh)
+2024-11-26,00:00,01:00,1.234
+2024-11-26,01:00,02:00,1.567
+2024-11-26,02:00,03:00,1.890
+"""
+
+# OpenData API responses
+_OPENDATA_DPC_RESPONSE: dict[str, Any] = {
+    "total_count": 2,
+    "results": [
+        {
+            "offre": "TPC-DPC",
+            "datedebut": "2024-12-15 13:00",
+            "datefin": "2024-12-15 17:00",
+            "plagehoraire": "PM",
+            "duree": "PT04H00MS",
+            "secteurclient": "Résidentiel",
+        },
+        {
+            "offre": "TPC-DPC",
+            "datedebut": "2024-12-16 13:00",
+            "datefin": "2024-12-16 17:00",
+            "plagehoraire": "PM",
+            "duree": "PT04H00MS",
+            "secteurclient": "Résidentiel",
+        },
+    ],
+}
+_OPENDATA_DCPC_RESPONSE: dict[str, Any] = {
+    "total_count": 2,
+    "results": [
+        {
+            "offre": "CPC-D",
+            "datedebut": "2024-12-15 06:00",
+            "datefin": "2024-12-15 10:00",
+            "plagehoraire": "AM",
+            "duree": "PT04H00MS",
+            "secteurclient": "Résidentiel",
+        },
+        {
+            "offre": "CPC-D",
+            "datedebut": "2024-12-15 16:00",
+            "datefin": "2024-12-15 20:00",
+            "plagehoraire": "PM",
+            "duree": "PT04H00MS",
+            "secteurclient": "Résidentiel",
+        },
+    ],
+}
+
+
+async def _async_noop(*args: Any, **kwargs: Any) -> None:
+    """Stand in for awaited mock methods whose calls no test inspects."""
+
+
+# Attribute surfaces of the mocked WebUser and PublicDataClient, used as spec_set
+_WEBUSER_ATTRS = [
+    "login",
+    "session_expired",
+    "close_session",
+    "get_info",
+    "fetch_customers_info",
+    "check_hq_portal_status",
+    "get_customer",
+    "customers",
+]
+_PUBLIC_CLIENT_ATTRS = ["rate_code", "peak_handler", "fetch_peak_data", "close_session"]
+
 
 @pytest.fixture
 def mock_config_entry() -> MockConfigEntry:
@@ -36,300 +189,232 @@ def mock_config_entry() -> MockConfigEntry:
     return MockConfigEntry(
         domain=DOMAIN,
         title="Test Account",
-        data={
-            CONF_AUTH_MODE: AUTH_MODE_PORTAL,
-            CONF_USERNAME: "test@example.com",
-            CONF_PASSWORD: "test_password",
-            CONF_CUSTOMER_ID: "test_customer_id",
-            CONF_ACCOUNT_ID: "test_account_id",
-            CONF_CONTRACT_ID: "contract123",
-            CONF_CONTRACT_NAME: "Home",
-            CONF_RATE: "D",
-            CONF_RATE_OPTION: "",
-            CONF_PREHEAT_DURATION: 120,
-        },
+        data=_PORTAL_DATA,
         unique_id="contract123",
     )
 
 
+# Config data overrides applied on top of mock_config_entry, keyed by variant id
+_ENTRY_VARIANTS: dict[str, dict[str, Any]] = {
+    "dpc": {CONF_RATE: "DPC"},
+    "dcpc": {CONF_RATE: "D", CONF_RATE_OPTION: "CPC"},
+    "dpc_calendar": {
+        CONF_RATE: "DPC",
+        CONF_RATE_OPTION: "",
+        CONF_CALENDAR_ENTITY_ID: "calendar.test",
+        "include_non_critical_peaks": False,
+    },
+    "dpc_missing_calendar": {CONF_RATE: "DPC", CONF_CALENDAR_ENTITY_ID: "calendar.missing"},
+    "d_calendar": {CONF_RATE: "D", CONF_RATE_OPTION: "", CONF_CALENDAR_ENTITY_ID: "calendar.test"},
+}
+
+
+@pytest.fixture
+def config_entry_variant(
+    request: pytest.FixtureRequest, hass: HomeAssistant, mock_config_entry: MockConfigEntry
+) -> MockConfigEntry:
+    """Return mock_config_entry with the parametrized variant's overrides, added to hass.
+
+    Without parametrization this is mock_config_entry itself (Rate D).
+    """
+    entry = mock_config_entry
+    if (variant := getattr(request, "param", None)) is not None:
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            data={**mock_config_entry.data, **_ENTRY_VARIANTS[variant]},
+            entry_id=mock_config_entry.entry_id,
+            unique_id=mock_config_entry.unique_id,
+        )
+    entry.add_to_hass(hass)
+    return entry
+
+
 @pytest.fixture
 def mock_webuser() -> MagicMock:
-    """Return a mock WebUser instance."""
-    webuser = MagicMock()
+    """Return a mock WebUser instance.
+
+    Customer and account are plain attribute bags; only the WebUser and
+    contract stay MagicMocks since tests assert calls or walk arbitrary
+    attribute paths on them.
+    """
+    webuser = MagicMock(spec_set=_WEBUSER_ATTRS)
     webuser.login = AsyncMock(return_value=True)
     webuser.session_expired = False
     webuser.close_session = AsyncMock()
     webuser.get_info = AsyncMock()
     webuser.fetch_customers_info = AsyncMock()
     webuser.check_hq_portal_status = AsyncMock(return_value=True)
-    webuser.get_customer = MagicMock()
 
     # Mock customer
-    customer = MagicMock()
-    customer.customer_id = "test_customer_id"
-    customer.get_info = AsyncMock()
-    customer.get_account = MagicMock()
+    customer = SimpleNamespace(customer_id="test_customer_id", get_info=_async_noop)
 
     # Mock account
-    account = MagicMock()
-    account.account_id = "test_account_id"
-    account.balance = 123.45
-    account.get_contract = MagicMock()
+    account = SimpleNamespace(account_id="test_account_id", balance=123.45)
 
     # Mock contract
-    contract = MagicMock()
-    contract.contract_id = "test_contract_id"
-    contract.rate = "D"
-    contract.rate_option = ""
-    contract.address = "123 Test St"
-    contract.cp_current_bill = 45.67
-    contract.cp_current_kWh = 350
-    contract.cp_avg_kWh = 320
-    contract.cp_projection_price = 75.00
-    contract.cp_projection_kwh = 500
-    contract.cp_avg_bill = 55.00
-    contract.cp_start_date = datetime(2024, 11, 1, tzinfo=EST_TIMEZONE).date()
-    contract.cp_end_date = datetime(2024, 11, 30, tzinfo=EST_TIMEZONE).date()
-    contract.get_periods_info = AsyncMock()
-    contract.refresh_outages = AsyncMock()
-    contract.get_hourly_consumption = AsyncMock()
-    contract.get_csv_consumption_history = AsyncMock()
+    contract = _make_contract("D")
 
     # Link objects
     customer.accounts = [account]
     account.contracts = [contract]
     webuser.customers = [customer]
 
-    # Setup return values for get methods to return from lists
-    def get_customer(customer_id: str) -> MagicMock:
-        return webuser.customers[0]
-
-    def get_account(account_id: str) -> MagicMock:
-        return customer.accounts[0]
+    # Get methods return from the lists at call time (tests swap contracts[0])
+    webuser.get_customer = lambda _customer_id: webuser.customers[0]
+    customer.get_account = lambda _account_id: customer.accounts[0]
+    account.get_contract = lambda _contract_id: account.contracts[0]
 
-    def get_contract(contract_id: str) -> MagicMock:
-        return account.contracts[0]
+    return webuser
 
-    webuser.get_customer = get_customer
-    customer.get_account = get_account
-    account.get_contract = get_contract
 
-    return webuser
+# Per-rate attributes for the mock contract fixtures
+_CONTRACT_SPECS: dict[str, dict[str, Any]] = {
+    "D": {
+        "attributes": {
+            "contract_id": "test_contract_id",
+            "rate": "D",
+            "rate_option": "",
+            "address": "123 Test St",
+            "cp_current_bill": 45.67,
+            "cp_current_kWh": 350,
+            "cp_avg_kWh": 320,
+            "cp_projection_price": 75.00,
+            "cp_projection_kwh": 500,
+            "cp_avg_bill": 55.00,
+        },
+        "hourly_energy": _TWO_POINT_HOURLY,
+    },
+    "DPC": {
+        "attributes": {
+            "contract_id": "test_contract_dpc",
+            "rate": "DPC",
+            "rate_option": "",
+            "address": "456 Peak St",
+            "cp_current_bill": 55.00,
+            "cp_current_kWh": 400,
+            "cp_avg_kWh": 380,
+            "cp_projection_price": 85.00,
+            "cp_projection_kwh": 600,
+            "cp_avg_bill": 65.00,
+        },
+        "peak_handler": {
+            "current_state": "Regular",
+            "next_event_date": _DPC_NEXT_EVENT,
+            "next_event_hour": "13",
+            "is_critical": False,
+            "is_preheat": False,
+            "critical_peak_count": 2,
+        },
+        "extra_methods": ["get_annual_consumption", "get_dpc_data"],
+        "hourly_energy": _ONE_POINT_HOURLY,
+    },
+    "DCPC": {
+        "attributes": {
+            "contract_id": "test_contract_dcpc",
+            "rate": "D",
+            "rate_option": "CPC",
+            "address": "789 Credit St",
+            "cp_current_bill": 50.00,
+            "cp_current_kWh": 375,
+            "cp_avg_kWh": 350,
+            "cp_projection_price": 80.00,
+            "cp_projection_kwh": 550,
+            "cp_avg_bill": 60.00,
+        },
+        "peak_handler": {
+            "cumulated_credit": 5.25,
+            "yesterday_peak_performance": "Good",
+            "yesterday_peak_hour": "17",
+            "current_state": "Regular",
+            "next_event_date": _DCPC_NEXT_EVENT,
+            "next_event_hour": "17",
+            "is_critical": False,
+        },
+        "hourly_energy": _ONE_POINT_HOURLY,
+    },
+}
 
 
-@pytest.fixture
-def mock_contract() -> MagicMock:
-    """Return a mock Contract instance."""
+def _make_contract(variant: str) -> MagicMock:
+    """Build a mock Contract for a rate variant of _CONTRACT_SPECS."""
+    spec = _CONTRACT_SPECS[variant]
     contract = MagicMock()
-    contract.contract_id = "test_contract_id"
-    contract.rate = "D"
-    contract.rate_option = ""
-    contract.address = "123 Test St"
-    contract.cp_current_bill = 45.67
-    contract.cp_current_kWh = 350
-    contract.cp_avg_kWh = 320
-    contract.cp_projection_price = 75.00
-    contract.cp_projection_kwh = 500
-    contract.cp_avg_bill = 55.00
-    contract.cp_start_date = datetime(2024, 11, 1, tzinfo=EST_TIMEZONE).date()
-    contract.cp_end_date = datetime(2024, 11, 30, tzinfo=EST_TIMEZONE).date()
+    for name, value in spec["attributes"].items():
+        setattr(contract, name, value)
+    contract.cp_start_date = _CP_START_DATE
+    contract.cp_end_date = _CP_END_DATE
+
+    # Mock peak handler
+    if "peak_handler" in spec:
+        peak_handler = MagicMock()
+        for name, value in spec["peak_handler"].items():
+            setattr(peak_handler, name, value)
+        peak_handler.refresh_data = _async_noop
+        contract.peak_handler = peak_handler
 
     # Mock methods
-    contract.get_info = AsyncMock()
-    contract.get_periods_info = AsyncMock()
-    contract.refresh_outages = AsyncMock()
-    contract.get_hourly_consumption = AsyncMock(
-        return_value={"results": {"listeDonneesConsoEnergieHoraire": []}}
-    )
-    contract.get_hourly_energy = AsyncMock(
-        return_value={
-            "results": {
-                "listeDonneesConsoEnergieHoraire": [
-                    {
-                        "dateHeureDebutPeriode": "2024-11-26 00:00",
-                        "consoReg": 1.234,
-                    },
-                    {
-                        "dateHeureDebutPeriode": "2024-11-26 01:00",
-                        "consoReg": 1.567,
-                    },
-                ]
-            }
-        }
-    )
+    contract.get_info = _async_noop
+    contract.get_periods_info = _async_noop
+    contract.refresh_outages = _async_noop
+    contract.get_hourly_consumption = AsyncMock(return_value=_EMPTY_HOURLY)
+    for name in spec.get("extra_methods", ()):
+        setattr(contract, name, _async_noop)
+    contract.get_hourly_energy = AsyncMock(return_value=spec["hourly_energy"])
 
     return contract
 
 
 @pytest.fixture
-def mock_contract_dpc() -> MagicMock:
-    """Return a mock ContractDPC instance with peak handler."""
-    contract = MagicMock()
-    contract.contract_id = "test_contract_dpc"
-    contract.rate = "DPC"
-    contract.rate_option = ""
-    contract.address = "456 Peak St"
-    contract.cp_current_bill = 55.00
-    contract.cp_current_kWh = 400
-    contract.cp_avg_kWh = 380
-    contract.cp_projection_price = 85.00
-    contract.cp_projection_kwh = 600
-    contract.cp_avg_bill = 65.00
-    contract.cp_start_date = datetime(2024, 11, 1, tzinfo=EST_TIMEZONE).date()
-    contract.cp_end_date = datetime(2024, 11, 30, tzinfo=EST_TIMEZONE).date()
-
-    # Mock peak handler
-    peak_handler = MagicMock()
-    peak_handler.current_state = "Regular"
-    peak_handler.next_event_date = datetime(2024, 12, 15, 13, 0, tzinfo=EST_TIMEZONE)
-    peak_handler.next_event_hour = "13"
-    peak_handler.is_critical = False
-    peak_handler.is_preheat = False
-    peak_handler.critical_peak_count = 2
-    contract.peak_handler = peak_handler
+def mock_contract() -> MagicMock:
+    """Return a mock Contract instance."""
+    return _make_contract("D")
 
-    # Mock methods
-    contract.get_info = AsyncMock()
-    contract.get_periods_info = AsyncMock()
-    contract.refresh_outages = AsyncMock()
-    contract.get_hourly_consumption = AsyncMock(
-        return_value={"results": {"listeDonneesConsoEnergieHoraire": []}}
-    )
-    contract.get_annual_consumption = AsyncMock()
-    contract.get_dpc_data = AsyncMock()
-
-    # Mock peak_handler methods
-    peak_handler.refresh_data = AsyncMock()
-
-    contract.get_hourly_energy = AsyncMock(
-        return_value={
-            "results": {
-                "listeDonneesConsoEnergieHoraire": [
-                    {
-                        "dateHeureDebutPeriode": "2024-11-26 00:00",
-                        "consoReg": 1.234,
-                    },
-                ]
-            }
-        }
-    )
 
-    return contract
+@pytest.fixture
+def mock_contract_dpc() -> MagicMock:
+    """Return a mock ContractDPC instance with peak handler."""
+    return _make_contract("DPC")
 
 
 @pytest.fixture
 def mock_contract_dcpc() -> MagicMock:
     """Return a mock ContractDCPC instance with winter credits."""
-    contract = MagicMock()
-    contract.contract_id = "test_contract_dcpc"
-    contract.rate = "D"
-    contract.rate_option = "CPC"
-    contract.address = "789 Credit St"
-    contract.cp_current_bill = 50.00
-    contract.cp_current_kWh = 375
-    contract.cp_avg_kWh = 350
-    contract.cp_projection_price = 80.00
-    contract.cp_projection_kwh = 550
-    contract.cp_avg_bill = 60.00
-    contract.cp_start_date = datetime(2024, 11, 1, tzinfo=EST_TIMEZONE).date()
-    contract.cp_end_date = datetime(2024, 11, 30, tzinfo=EST_TIMEZONE).date()
-
-    # Mock peak handler with winter credits
-    peak_handler = MagicMock()
-    peak_handler.cumulated_credit = 5.25
-    peak_handler.yesterday_peak_performance = "Good"
-    peak_handler.yesterday_peak_hour = "17"
-    peak_handler.current_state = "Regular"
-    peak_handler.next_event_date = datetime(2024, 12, 10, 17, 0, tzinfo=EST_TIMEZONE)
-    peak_handler.next_event_hour = "17"
-    peak_handler.is_critical = False
-    contract.peak_handler = peak_handler
+    return _make_contract("DCPC")
 
-    # Mock methods
-    contract.get_info = AsyncMock()
-    contract.get_periods_info = AsyncMock()
-    contract.refresh_outages = AsyncMock()
-    contract.get_hourly_consumption = AsyncMock(
-        return_value={"results": {"listeDonneesConsoEnergieHoraire": []}}
-    )
 
-    # Mock peak_handler methods
-    peak_handler.refresh_data = AsyncMock()
-
-    contract.get_hourly_energy = AsyncMock(
-        return_value={
-            "results": {
-                "listeDonneesConsoEnergieHoraire": [
-                    {
-                        "dateHeureDebutPeriode": "2024-11-26 00:00",
-                        "consoReg": 1.234,
-                    },
-                ]
-            }
-        }
+@pytest.fixture
+def portal_contract(request: pytest.FixtureRequest) -> MagicMock:
+    """Return the contract served by the mock WebUser (Rate D unless parametrized)."""
+    return request.getfixturevalue(getattr(request, "param", "mock_contract"))
+
+
+# 24 hourly statistics for 2024-11-26 (no DST change, so hours are 3600s apart)
+_SAMPLE_STATS_BASE_TS = datetime(2024, 11, 26, 0, 0, tzinfo=EST_TIMEZONE).timestamp()
+_SAMPLE_STATS_CONSUMPTION = [1.5 + (hour % 3) * 0.5 for hour in range(24)]
+_SAMPLE_STATISTICS = [
+    {"start": _SAMPLE_STATS_BASE_TS + hour * 3600, "state": consumption, "sum": cumulative}
+    for hour, (consumption, cumulative) in enumerate(
+        zip(_SAMPLE_STATS_CONSUMPTION, accumulate(_SAMPLE_STATS_CONSUMPTION), strict=True)
     )
-
-    return contract
+]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_statistics() -> list[dict[str, Any]]:
     """Return sample statistics for testing."""
-    base_time = datetime(2024, 11, 26, 0, 0, tzinfo=EST_TIMEZONE)
-    stats = []
-    cumulative = 0.0
-
-    for hour in range(24):
-        consumption = 1.5 + (hour % 3) * 0.5
-        cumulative += consumption
-        stats.append(
-            {
-                "start": base_time.replace(hour=hour).timestamp(),
-                "state": consumption,
-                "sum": cumulative,
-            }
-        )
-
-    return stats
+    return _SAMPLE_STATISTICS
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_csv_data() -> str:
     """Return sample CSV data for testing."""
-    return """Date,Heure début,Heure fin,Consommation (kWh)
-2024-11-26,00:00,01:00,1.234
-2024-11-26,01:00,02:00,1.567
-2024-11-26,02:00,03:00,1.890
-"""
+    return _SAMPLE_CSV
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_hourly_json() -> dict[str, Any]:
     """Return sample hourly consumption JSON for testing."""
-    return {
-        "results": {
-            "listeDonneesConsoEnergieHoraire": [
-                {
-                    "dateHeureDebutPeriode": "2024-11-26 00:00",
-                    "consoReg": 1.234,
-                    "consoHaut": None,
-                    "consoTotal": 1.234,
-                },
-                {
-                    "dateHeureDebutPeriode": "2024-11-26 01:00",
-                    "consoReg": 1.567,
-                    "consoHaut": None,
-                    "consoTotal": 1.567,
-                },
-                {
-                    "dateHeureDebutPeriode": "2024-11-26 02:00",
-                    "consoReg": 1.890,
-                    "consoHaut": None,
-                    "consoTotal": 1.890,
-                },
-            ]
-        }
-    }
+    return _SAMPLE_HOURLY_JSON
 
 
 @pytest.fixture
@@ -353,7 +438,7 @@ def mock_statistics_api() -> Generator[MagicMock]:
         yield mock
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def statistics_metadata() -> dict[str, Any]:
     """Return sample statistics metadata."""
     return {
@@ -376,43 +461,30 @@ def mock_integration_version() -> Generator[AsyncMock]:
 
     # Patch where it's imported (in sensor.py and binary_sensor.py)
     with (
-        patch(
-            "custom_components.hydroqc.sensor.async_get_integration",
+        patch.object(
+            sensor_module,
+            "async_get_integration",
             new=AsyncMock(return_value=mock_integration),
         ) as mock_sensor,
-        patch(
-            "custom_components.hydroqc.binary_sensor.async_get_integration",
+        patch.object(
+            binary_sensor_module,
+            "async_get_integration",
             new=AsyncMock(return_value=mock_integration),
         ),
     ):
         yield mock_sensor
 
 
-@pytest.fixture
-async def hass_with_recorder(hass: HomeAssistant) -> HomeAssistant:
-    """Return a Home Assistant instance with recorder set up."""
-    # The recorder component will be automatically set up by pytest-homeassistant
-    # Just return the hass instance
-    return hass
-
-
 # OpenData mode fixtures
 
 
 @pytest.fixture
 def mock_config_entry_opendata() -> MockConfigEntry:
     """Return a mock config entry for OpenData mode testing."""
-    from custom_components.hydroqc.const import AUTH_MODE_OPENDATA
-
     return MockConfigEntry(
         domain=DOMAIN,
         title="Test OpenData DPC",
-        data={
-            CONF_AUTH_MODE: AUTH_MODE_OPENDATA,
-            CONF_RATE: "DPC",
-            CONF_RATE_OPTION: "",
-            CONF_PREHEAT_DURATION: 120,
-        },
+        data=_OPENDATA_DATA,
         unique_id="opendata_dpc",
     )
 
@@ -420,135 +492,75 @@ def mock_config_entry_opendata() -> MockConfigEntry:
 @pytest.fixture
 def mock_config_entry_opendata_dcpc() -> MockConfigEntry:
     """Return a mock config entry for OpenData mode DCPC testing."""
-    from custom_components.hydroqc.const import AUTH_MODE_OPENDATA
-
     return MockConfigEntry(
         domain=DOMAIN,
         title="Test OpenData DCPC",
-        data={
-            CONF_AUTH_MODE: AUTH_MODE_OPENDATA,
-            CONF_RATE: "D",
-            CONF_RATE_OPTION: "CPC",
-            CONF_PREHEAT_DURATION: 120,
-        },
+        data=_OPENDATA_DCPC_DATA,
         unique_id="opendata_dcpc",
     )
 
 
-@pytest.fixture
-def mock_public_client() -> MagicMock:
-    """Return a mock PublicDataClient instance."""
-    client = MagicMock()
-    client.rate_code = "DPC"
+def _make_public_client(
+    rate_code: str,
+    today_morning: SimpleNamespace | None = None,
+    today_evening: SimpleNamespace | None = None,
+) -> MagicMock:
+    """Build a mock PublicDataClient with a quiet (no peak) peak handler."""
+    client = MagicMock(spec_set=_PUBLIC_CLIENT_ATTRS)
+    client.rate_code = rate_code
     client.fetch_peak_data = AsyncMock()
     client.close_session = AsyncMock()
+    client.peak_handler = SimpleNamespace(
+        _events=[],
+        current_state="normal",
+        next_peak=None,
+        next_critical_peak=None,
+        current_peak=None,
+        preheat_in_progress=False,
+        peak_in_progress=False,
+        is_any_critical_peak_coming=False,
+        today_morning_peak=today_morning,
+        today_evening_peak=today_evening,
+        tomorrow_morning_peak=None,
+        tomorrow_evening_peak=None,
+    )
+    return client
 
-    # Mock peak handler
-    peak_handler = MagicMock()
-    peak_handler.current_state = "normal"
-    peak_handler.next_peak = None
-    peak_handler.next_critical_peak = None
-    peak_handler.current_peak = None
-    peak_handler.preheat_in_progress = False
-    peak_handler.peak_in_progress = False
-    peak_handler.is_any_critical_peak_coming = False
-    peak_handler.today_morning_peak = None
-    peak_handler.today_evening_peak = None
-    peak_handler.tomorrow_morning_peak = None
-    peak_handler.tomorrow_evening_peak = None
-    client.peak_handler = peak_handler
 
-    return client
+@pytest.fixture
+def mock_public_client() -> MagicMock:
+    """Return a mock PublicDataClient instance."""
+    return _make_public_client("DPC")
 
 
 @pytest.fixture
 def mock_public_client_dcpc() -> MagicMock:
     """Return a mock PublicDataClient instance for DCPC (Winter Credits)."""
-    client = MagicMock()
-    client.rate_code = "DCPC"
-    client.fetch_peak_data = AsyncMock()
-    client.close_session = AsyncMock()
-
-    # Mock peak handler with winter credits data
-    peak_handler = MagicMock()
-    peak_handler.current_state = "normal"
-    peak_handler.next_peak = None
-    peak_handler.next_critical_peak = None
-    peak_handler.current_peak = None
-    peak_handler.preheat_in_progress = False
-    peak_handler.peak_in_progress = False
-    peak_handler.is_any_critical_peak_coming = False
-
-    # Mock today's peaks (non-critical generated schedule)
-    today_morning = MagicMock()
-    today_morning.start_date = datetime(2024, 12, 15, 6, 0, tzinfo=EST_TIMEZONE)
-    today_morning.end_date = datetime(2024, 12, 15, 10, 0, tzinfo=EST_TIMEZONE)
-    today_morning.is_critical = False
-    today_morning.time_slot = "AM"
-
-    today_evening = MagicMock()
-    today_evening.start_date = datetime(2024, 12, 15, 16, 0, tzinfo=EST_TIMEZONE)
-    today_evening.end_date = datetime(2024, 12, 15, 20, 0, tzinfo=EST_TIMEZONE)
-    today_evening.is_critical = False
-    today_evening.time_slot = "PM"
-
-    peak_handler.today_morning_peak = today_morning
-    peak_handler.today_evening_peak = today_evening
-    peak_handler.tomorrow_morning_peak = None
-    peak_handler.tomorrow_evening_peak = None
-
-    client.peak_handler = peak_handler
-
-    return client
+    # Today's peaks come from the non-critical generated schedule
+    return _make_public_client(
+        "DCPC",
+        today_morning=SimpleNamespace(
+            start_date=_TODAY_AM_START,
+            end_date=_TODAY_AM_END,
+            is_critical=False,
+            time_slot="AM",
+        ),
+        today_evening=SimpleNamespace(
+            start_date=_TODAY_PM_START,
+            end_date=_TODAY_PM_END,
+            is_critical=False,
+            time_slot="PM",
+        ),
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_opendata_api_response() -> dict[str, Any]:
     """Return sample OpenData API response for testing."""
-    return {
-        "total_count": 2,
-        "results": [
-            {
-                "offre": "TPC-DPC",
-                "datedebut": "2024-12-15 13:00",
-                "datefin": "2024-12-15 17:00",
-                "plagehoraire": "PM",
-                "duree": "PT04H00MS",
-                "secteurclient": "Résidentiel",
-            },
-            {
-                "offre": "TPC-DPC",
-                "datedebut": "2024-12-16 13:00",
-                "datefin": "2024-12-16 17:00",
-                "plagehoraire": "PM",
-                "duree": "PT04H00MS",
-                "secteurclient": "Résidentiel",
-            },
-        ],
-    }
+    return _OPENDATA_DPC_RESPONSE
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_opendata_api_response_dcpc() -> dict[str, Any]:
     """Return sample OpenData API response for DCPC (Winter Credits) testing."""
-    return {
-        "total_count": 2,
-        "results": [
-            {
-                "offre": "CPC-D",
-                "datedebut": "2024-12-15 06:00",
-                "datefin": "2024-12-15 10:00",
-                "plagehoraire": "AM",
-                "duree": "PT04H00MS",
-                "secteurclient": "Résidentiel",
-            },
-            {
-                "offre": "CPC-D",
-                "datedebut": "2024-12-15 16:00",
-                "datefin": "2024-12-15 20:00",
-                "plagehoraire": "PM",
-                "duree": "PT04H00MS",
-                "secteurclient": "Résidentiel",
-            },
-        ],
-    }
+    return _OPENDATA_DCPC_RESPONSE
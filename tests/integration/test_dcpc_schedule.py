@@ -10,34 +10,94 @@ Tests verify:
 
 import datetime
 import zoneinfo
+from collections.abc import Generator, Mapping
+from types import MappingProxyType
+from typing import Any
 
 import pytest
 from freezegun import freeze_time
 
 from custom_components.hydroqc.public_data_client import PeakHandler
 
+EST_TIMEZONE = zoneinfo.ZoneInfo("America/Toronto")
+EST_OFFSET = datetime.timedelta(hours=-5)
+EDT_OFFSET = datetime.timedelta(hours=-4)
+
+# Fields shared by every Winter Credits API announcement
+_BASE_CPC_EVENT = {
+    "offre": "CPC-D",
+    "duree": "PT04H00MS",
+    "secteurclient": "Résidentiel",
+}
+
+
+# Peak start/end hours per API time slot
+_SLOT_HOURS = {"AM": (6, 10), "PM": (16, 20)}
+
+
+def _make_event(day: datetime.date, time_slot: str) -> Mapping[str, Any]:
+    """Build a read-only Winter Credits API event with pre-built local datetimes."""
+    start_hour, end_hour = _SLOT_HOURS[time_slot]
+    return MappingProxyType(
+        {
+            **_BASE_CPC_EVENT,
+            "datedebut": datetime.datetime.combine(day, datetime.time(start_hour), EST_TIMEZONE),
+            "datefin": datetime.datetime.combine(day, datetime.time(end_hour), EST_TIMEZONE),
+            "plagehoraire": time_slot,
+        }
+    )
+
+
+def _make_api_event(day: datetime.date, time_slot: str) -> Mapping[str, Any]:
+    """Build a read-only Winter Credits API event with dates in the API's string form."""
+    start_hour, end_hour = _SLOT_HOURS[time_slot]
+    return MappingProxyType(
+        {
+            **_BASE_CPC_EVENT,
+            "datedebut": f"{day.isoformat()} {start_hour:02d}:00",
+            "datefin": f"{day.isoformat()} {end_hour:02d}:00",
+            "plagehoraire": time_slot,
+        }
+    )
+
 
 class TestDCPCScheduleGeneration:
     """Test DCPC schedule generation and seasonal behavior."""
 
-    @pytest.fixture
-    def dcpc_handler(self) -> PeakHandler:
-        """Create DCPC PeakHandler."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def dcpc_handler(cls) -> PeakHandler:
+        """Create DCPC PeakHandler shared by all tests in the class."""
         return PeakHandler(rate_code="DCPC", preheat_duration=120)
 
+    @pytest.fixture(autouse=True)
+    def reset_handler(self, dcpc_handler: PeakHandler) -> None:
+        """Start each test from an empty shared handler, whatever the previous test loaded."""
+        dcpc_handler.load_events([])
+
     # ========================================================================
     # OUTSIDE WINTER SEASON TESTS
     # ========================================================================
 
-    @freeze_time("2025-06-15T12:00:00-04:00")  # Summer - outside winter season
-    def test_outside_winter_no_schedule_generated(self, dcpc_handler: PeakHandler) -> None:
-        """Test that no schedule is generated outside winter season (June)."""
-        # Load no API events
-        dcpc_handler.load_events([])
-
-        # Verify no events generated
-        assert len(dcpc_handler._events) == 0
-        assert dcpc_handler.current_state == "off_season"
+    @pytest.mark.parametrize(
+        "frozen",
+        [
+            pytest.param("2025-06-15T12:00:00-04:00", id="summer"),
+            pytest.param("2025-10-01T12:00:00-04:00", id="october"),
+            pytest.param("2025-04-15T12:00:00-04:00", id="april"),
+        ],
+    )
+    def test_outside_winter_no_schedule_generated(
+        self, dcpc_handler: PeakHandler, frozen: str
+    ) -> None:
+        """Test that no schedule is generated before Dec 1 or after Mar 31."""
+        with freeze_time(frozen):
+            # Load no API events
+            dcpc_handler.load_events([])
+
+            # Verify no events generated
+            assert len(dcpc_handler._events) == 0
+            assert dcpc_handler.current_state == "off_season"
 
     @freeze_time("2025-06-15T12:00:00-04:00")  # Summer
     def test_outside_winter_binary_sensors_false(self, dcpc_handler: PeakHandler) -> None:
@@ -54,20 +114,6 @@ class TestDCPCScheduleGeneration:
         # This is handled by coordinator.get_sensor_value() returning False for .is_critical
         # when intermediate object is None
 
-    @freeze_time("2025-10-01T12:00:00-04:00")  # October - outside winter
-    def test_october_outside_winter(self, dcpc_handler: PeakHandler) -> None:
-        """Test October (before winter starts Dec 1)."""
-        dcpc_handler.load_events([])
-        assert len(dcpc_handler._events) == 0
-        assert dcpc_handler.current_state == "off_season"
-
-    @freeze_time("2025-04-15T12:00:00-04:00")  # April - after winter ends
-    def test_april_after_winter_ends(self, dcpc_handler: PeakHandler) -> None:
-        """Test April (after winter ends Mar 31)."""
-        dcpc_handler.load_events([])
-        assert len(dcpc_handler._events) == 0
-        assert dcpc_handler.current_state == "off_season"
-
     # ========================================================================
     # BEGINNING OF WINTER - NO CRITICAL PEAKS
     # ========================================================================
@@ -88,14 +134,16 @@ class TestDCPCScheduleGeneration:
         # Verify today's peaks exist
         today_morning = dcpc_handler.today_morning_peak
         assert today_morning is not None
-        assert today_morning.start_date.hour == 6
-        assert today_morning.end_date.hour == 10
+        start_date, end_date = today_morning.start_date, today_morning.end_date
+        assert start_date.hour == 6
+        assert end_date.hour == 10
         assert today_morning.is_critical is False
 
         today_evening = dcpc_handler.today_evening_peak
         assert today_evening is not None
-        assert today_evening.start_date.hour == 16
-        assert today_evening.end_date.hour == 20
+        start_date, end_date = today_evening.start_date, today_evening.end_date
+        assert start_date.hour == 16
+        assert end_date.hour == 20
         assert today_evening.is_critical is False
 
         # Verify tomorrow's peaks exist
@@ -115,14 +163,7 @@ class TestDCPCScheduleGeneration:
     def test_beginning_winter_with_critical_morning_peak(self, dcpc_handler: PeakHandler) -> None:
         """Test beginning of winter with API announcing critical morning peak for today."""
         # API announces critical morning peak for today
-        api_event_today_morning = {
-            "offre": "CPC-D",
-            "datedebut": "2024-12-05T06:00:00-05:00",
-            "datefin": "2024-12-05T10:00:00-05:00",
-            "plagehoraire": "AM",
-            "duree": "PT04H00MS",
-            "secteurclient": "Résidentiel",
-        }
+        api_event_today_morning = _make_event(datetime.date(2024, 12, 5), "AM")
 
         dcpc_handler.load_events([api_event_today_morning])
 
@@ -153,22 +194,8 @@ class TestDCPCScheduleGeneration:
         """Test beginning of winter with multiple critical peaks announced."""
         # API announces critical peaks for today evening and tomorrow morning
         api_events = [
-            {
-                "offre": "CPC-D",
-                "datedebut": "2024-12-05T16:00:00-05:00",
-                "datefin": "2024-12-05T20:00:00-05:00",
-                "plagehoraire": "PM",
-                "duree": "PT04H00MS",
-                "secteurclient": "Résidentiel",
-            },
-            {
-                "offre": "CPC-D",
-                "datedebut": "2024-12-06T06:00:00-05:00",
-                "datefin": "2024-12-06T10:00:00-05:00",
-                "plagehoraire": "AM",
-                "duree": "PT04H00MS",
-                "secteurclient": "Résidentiel",
-            },
+            _make_event(datetime.date(2024, 12, 5), "PM"),
+            _make_event(datetime.date(2024, 12, 6), "AM"),
         ]
 
         dcpc_handler.load_events(api_events)
@@ -177,8 +204,8 @@ class TestDCPCScheduleGeneration:
         assert len(dcpc_handler._events) == 4
 
         # Count critical vs non-critical
-        critical_count = sum(1 for e in dcpc_handler._events if e.is_critical)
-        non_critical_count = sum(1 for e in dcpc_handler._events if not e.is_critical)
+        critical_count = sum(e.is_critical for e in dcpc_handler._events)
+        non_critical_count = len(dcpc_handler._events) - critical_count
         assert critical_count == 2
         assert non_critical_count == 2
 
@@ -200,38 +227,43 @@ class TestDCPCScheduleGeneration:
         assert tomorrow_evening.is_critical is False  # Not announced, generated
 
     # ========================================================================
-    # END OF WINTER - BEFORE DST (March, before DST)
+    # END OF WINTER - NO CRITICAL PEAKS (before, during and after DST)
     # ========================================================================
 
-    @freeze_time("2025-03-05T10:00:00-05:00")  # March 5, 2025 (before DST on March 9)
-    def test_end_winter_before_dst_no_critical(self, dcpc_handler: PeakHandler) -> None:
-        """Test end of winter before DST transition with no critical peaks."""
-        dcpc_handler.load_events([])
-
-        # Still within winter season, should generate schedule
-        assert len(dcpc_handler._events) == 4
+    @pytest.mark.parametrize(
+        ("frozen", "utc_offset"),
+        [
+            # March 5, 2025 (before DST on March 9) - EST
+            pytest.param("2025-03-05T10:00:00-05:00", EST_OFFSET, id="before_dst"),
+            # March 9, 2025 - DST transition day (after 2 AM); 6 AM peak is in EDT
+            pytest.param("2025-03-09T10:00:00-04:00", EDT_OFFSET, id="dst_day"),
+            # March 25, 2025 (after DST, before end of season) - EDT
+            pytest.param("2025-03-25T10:00:00-04:00", EDT_OFFSET, id="after_dst"),
+        ],
+    )
+    def test_end_winter_no_critical(
+        self, dcpc_handler: PeakHandler, frozen: str, utc_offset: datetime.timedelta
+    ) -> None:
+        """Test end of winter around the DST transition with no critical peaks."""
+        with freeze_time(frozen):
+            dcpc_handler.load_events([])
+
+            # Still within winter season (ends Mar 31), should generate schedule
+            assert len(dcpc_handler._events) == 4
+
+            # All non-critical and timezone-aware with the local offset
+            for event in dcpc_handler._events:
+                assert event.start_date.utcoffset() == utc_offset
+                assert event.is_critical is False
 
-        # All should be non-critical
-        for event in dcpc_handler._events:
-            assert event.is_critical is False
-
-        # Verify peaks exist and are timezone-aware
-        today_morning = dcpc_handler.today_morning_peak
-        assert today_morning is not None
-        assert today_morning.start_date.tzinfo is not None
-        assert today_morning.start_date.strftime("%z") == "-0500"  # EST
+    # ========================================================================
+    # END OF WINTER - BEFORE DST (March, before DST)
+    # ========================================================================
 
     @freeze_time("2025-03-05T10:00:00-05:00")  # March 5, 2025
     def test_end_winter_before_dst_with_critical(self, dcpc_handler: PeakHandler) -> None:
         """Test end of winter before DST with critical peak announced."""
-        api_event = {
-            "offre": "CPC-D",
-            "datedebut": "2025-03-05T16:00:00-05:00",
-            "datefin": "2025-03-05T20:00:00-05:00",
-            "plagehoraire": "PM",
-            "duree": "PT04H00MS",
-            "secteurclient": "Résidentiel",
-        }
+        api_event = _make_event(datetime.date(2025, 3, 5), "PM")
 
         dcpc_handler.load_events([api_event])
 
@@ -245,70 +277,28 @@ class TestDCPCScheduleGeneration:
     # END OF WINTER - DURING DST TRANSITION
     # ========================================================================
 
-    @freeze_time("2025-03-09T10:00:00-04:00")  # March 9, 2025 - DST transition day (after 2 AM)
-    def test_end_winter_dst_day_no_critical(self, dcpc_handler: PeakHandler) -> None:
-        """Test end of winter on DST transition day with no critical peaks."""
-        dcpc_handler.load_events([])
-
-        # Should generate schedule (still within winter)
-        assert len(dcpc_handler._events) == 4
-
-        # Verify timezone handling across DST
-        today_morning = dcpc_handler.today_morning_peak
-        assert today_morning is not None
-        # Morning peak starts at 6 AM, which is after DST transition (2 AM -> 3 AM)
-        # So it should be in EDT (-04:00)
-        assert today_morning.start_date.strftime("%z") == "-0400"  # EDT
-
     @freeze_time("2025-03-09T10:00:00-04:00")  # March 9, 2025 - DST day
     def test_end_winter_dst_day_with_critical(self, dcpc_handler: PeakHandler) -> None:
         """Test end of winter on DST day with critical peak."""
-        # Critical evening peak on DST day
-        api_event = {
-            "offre": "CPC-D",
-            "datedebut": "2025-03-09T16:00:00-04:00",  # EDT
-            "datefin": "2025-03-09T20:00:00-04:00",
-            "plagehoraire": "PM",
-            "duree": "PT04H00MS",
-            "secteurclient": "Résidentiel",
-        }
+        # Critical evening peak on DST day (EDT), dates as the API sends them
+        api_event = _make_api_event(datetime.date(2025, 3, 9), "PM")
 
         dcpc_handler.load_events([api_event])
 
         today_evening = dcpc_handler.today_evening_peak
         assert today_evening is not None
         assert today_evening.is_critical is True
-        assert today_evening.start_date.strftime("%z") == "-0400"  # EDT
+        assert today_evening.start_date.utcoffset() == EDT_OFFSET
 
     # ========================================================================
     # END OF WINTER - AFTER DST
     # ========================================================================
 
-    @freeze_time("2025-03-25T10:00:00-04:00")  # March 25, 2025 (after DST, before end of season)
-    def test_end_winter_after_dst_no_critical(self, dcpc_handler: PeakHandler) -> None:
-        """Test end of winter after DST transition with no critical peaks."""
-        dcpc_handler.load_events([])
-
-        # Still within winter season (ends Mar 31)
-        assert len(dcpc_handler._events) == 4
-
-        # All in EDT now
-        for event in dcpc_handler._events:
-            assert event.start_date.strftime("%z") == "-0400"
-            assert event.is_critical is False
-
     @freeze_time("2025-03-30T10:00:00-04:00")  # March 30, 2025 - second to last day of winter
     def test_last_days_winter_with_critical(self, dcpc_handler: PeakHandler) -> None:
         """Test last days of winter season with critical peaks."""
         # Critical peak on tomorrow (Mar 31, last day of winter)
-        api_event = {
-            "offre": "CPC-D",
-            "datedebut": "2025-03-31T06:00:00-04:00",
-            "datefin": "2025-03-31T10:00:00-04:00",
-            "plagehoraire": "AM",
-            "duree": "PT04H00MS",
-            "secteurclient": "Résidentiel",
-        }
+        api_event = _make_event(datetime.date(2025, 3, 31), "AM")
 
         dcpc_handler.load_events([api_event])
 
@@ -330,14 +320,17 @@ class TestDCPCScheduleGeneration:
         # Generator creates 4 peaks: today (Mar 31) + tomorrow (Apr 1)
         assert len(dcpc_handler._events) == 4
 
+        last_winter_day = datetime.date(2025, 3, 31)
+        first_spring_day = datetime.date(2025, 4, 1)
+
         # Today's peaks (Mar 31) - still in season
         today_morning = dcpc_handler.today_morning_peak
         today_evening = dcpc_handler.today_evening_peak
         assert today_morning is not None
         assert today_evening is not None
-        assert today_morning.start_date.date() == datetime.date(2025, 3, 31)
+        assert today_morning.start_date.date() == last_winter_day
         assert today_morning.is_critical is False
-        assert today_evening.start_date.date() == datetime.date(2025, 3, 31)
+        assert today_evening.start_date.date() == last_winter_day
         assert today_evening.is_critical is False
 
         # Tomorrow (Apr 1) - outside season but still generated
@@ -345,9 +338,9 @@ class TestDCPCScheduleGeneration:
         tomorrow_evening = dcpc_handler.tomorrow_evening_peak
         assert tomorrow_morning is not None
         assert tomorrow_evening is not None
-        assert tomorrow_morning.start_date.date() == datetime.date(2025, 4, 1)
+        assert tomorrow_morning.start_date.date() == first_spring_day
         assert tomorrow_morning.is_critical is False
-        assert tomorrow_evening.start_date.date() == datetime.date(2025, 4, 1)
+        assert tomorrow_evening.start_date.date() == first_spring_day
         assert tomorrow_evening.is_critical is False
 
     # ========================================================================
@@ -369,8 +362,7 @@ class TestDCPCScheduleGeneration:
         assert anchor.end_date.hour == 4
 
         # Verify we're currently in the anchor period
-        tz = zoneinfo.ZoneInfo("America/Toronto")
-        now = datetime.datetime.now(tz)
+        now = datetime.datetime.now(EST_TIMEZONE)
         assert anchor.start_date <= now < anchor.end_date
 
     @freeze_time("2024-12-10T13:00:00-05:00")  # Dec 10, 2024 at 1 PM (during evening anchor)
@@ -387,91 +379,78 @@ class TestDCPCScheduleGeneration:
         assert anchor.end_date.hour == 14
 
         # Verify we're in the anchor
-        tz = zoneinfo.ZoneInfo("America/Toronto")
-        now = datetime.datetime.now(tz)
+        now = datetime.datetime.now(EST_TIMEZONE)
         assert anchor.start_date <= now < anchor.end_date
 
-    @freeze_time("2024-12-15T10:00:00-05:00")  # Dec 15, 2024
-    def test_anchor_inherits_critical_status(self, dcpc_handler: PeakHandler) -> None:
-        """Test that anchor periods inherit is_critical from their peak."""
-        # Critical morning peak
-        api_event = {
-            "offre": "CPC-D",
-            "datedebut": "2024-12-15T06:00:00-05:00",
-            "datefin": "2024-12-15T10:00:00-05:00",
-            "plagehoraire": "AM",
-            "duree": "PT04H00MS",
-            "secteurclient": "Résidentiel",
-        }
-
-        dcpc_handler.load_events([api_event])
-
-        today_morning = dcpc_handler.today_morning_peak
-        assert today_morning is not None
-        assert today_morning.is_critical is True
-
-        # Anchor should also be critical
-        anchor = today_morning.anchor
-        assert anchor.is_critical is True
-
-        # Non-critical evening peak
-        today_evening = dcpc_handler.today_evening_peak
-        assert today_evening is not None
-        assert today_evening.is_critical is False
-
-        # Anchor should also be non-critical
-        anchor_evening = today_evening.anchor
-        assert anchor_evening.is_critical is False
-
     # ========================================================================
     # DETAILED ANCHOR PERIOD TESTS
     # ========================================================================
 
-    @freeze_time("2024-12-10T10:00:00-05:00")
-    def test_anchor_period_timing_morning(self, dcpc_handler: PeakHandler) -> None:
-        """Test morning anchor period timing calculations."""
-        # Load schedule (generates non-critical peaks)
-        dcpc_handler.load_events([])
-
-        # Get today's morning peak
-        morning_peak = dcpc_handler.today_morning_peak
-        assert morning_peak is not None
-        assert morning_peak.is_critical is False
-
-        anchor = morning_peak.anchor
-        assert anchor is not None
-        assert anchor.is_critical is False
-
-        # Morning anchor: 5 hours before peak, 3 hours duration
-        # Peak at 6:00, anchor should start at 1:00
-        assert anchor.start_date.hour == 1
-        assert anchor.end_date.hour == 4
-
-        duration_hours = (anchor.end_date - anchor.start_date).total_seconds() / 3600
-        assert duration_hours == 3.0
-
-    @freeze_time("2024-12-10T10:00:00-05:00")
-    def test_anchor_period_timing_evening(self, dcpc_handler: PeakHandler) -> None:
-        """Test evening anchor period timing calculations."""
-        # Load schedule (generates non-critical peaks)
-        dcpc_handler.load_events([])
-
-        # Get today's evening peak
-        evening_peak = dcpc_handler.today_evening_peak
-        assert evening_peak is not None
-        assert evening_peak.is_critical is False
-
-        anchor = evening_peak.anchor
-        assert anchor is not None
-        assert anchor.is_critical is False
-
-        # Evening anchor: 4 hours before peak, 2 hours duration
-        # Peak at 16:00, anchor should start at 12:00
-        assert anchor.start_date.hour == 12
-        assert anchor.end_date.hour == 14
-
-        duration_hours = (anchor.end_date - anchor.start_date).total_seconds() / 3600
-        assert duration_hours == 2.0
+    class TestAnchorPeriodsSameTime:
+        """Anchor tests sharing a single frozen time."""
+
+        @pytest.fixture(scope="class", autouse=True)
+        @classmethod
+        def _frozen_clock(cls) -> Generator[None]:
+            """Freeze the clock at Dec 10, 2024 10 AM once for the whole class."""
+            with freeze_time("2024-12-10T10:00:00-05:00"):
+                yield
+
+        def test_anchor_inherits_critical_status(self, dcpc_handler: PeakHandler) -> None:
+            """Test that anchor periods inherit is_critical from their peak."""
+            # Critical morning peak
+            api_event = _make_event(datetime.date(2024, 12, 10), "AM")
+
+            dcpc_handler.load_events([api_event])
+
+            today_morning = dcpc_handler.today_morning_peak
+            assert today_morning is not None
+            assert today_morning.is_critical is True
+
+            # Anchor should also be critical
+            anchor = today_morning.anchor
+            assert anchor.is_critical is True
+
+            # Non-critical evening peak
+            today_evening = dcpc_handler.today_evening_peak
+            assert today_evening is not None
+            assert today_evening.is_critical is False
+
+            # Anchor should also be non-critical
+            anchor_evening = today_evening.anchor
+            assert anchor_evening.is_critical is False
+
+        @pytest.mark.parametrize(
+            ("peak_property", "start_hour", "end_hour", "duration_hours"),
+            [
+                # Morning anchor: 5 hours before the 6:00 peak, 3 hours duration
+                pytest.param("today_morning_peak", 1, 4, 3.0, id="morning"),
+                # Evening anchor: 4 hours before the 16:00 peak, 2 hours duration
+                pytest.param("today_evening_peak", 12, 14, 2.0, id="evening"),
+            ],
+        )
+        def test_anchor_period_timing(
+            self,
+            dcpc_handler: PeakHandler,
+            peak_property: str,
+            start_hour: int,
+            end_hour: int,
+            duration_hours: float,
+        ) -> None:
+            """Test morning and evening anchor period timing calculations."""
+            # Load schedule (generates non-critical peaks)
+            dcpc_handler.load_events([])
+
+            peak = getattr(dcpc_handler, peak_property)
+            assert peak is not None
+            assert peak.is_critical is False
+
+            anchor = peak.anchor
+            assert anchor is not None
+            assert anchor.is_critical is False
+            assert anchor.start_date.hour == start_hour
+            assert anchor.end_date.hour == end_hour
+            assert (anchor.end_date - anchor.start_date).total_seconds() / 3600 == duration_hours
 
     # ========================================================================
     # TOMORROW PEAK DETECTION
@@ -481,14 +460,7 @@ class TestDCPCScheduleGeneration:
     def test_tomorrow_peak_flags(self, dcpc_handler: PeakHandler) -> None:
         """Test tomorrow peak detection for binary sensors."""
         # Load schedule with tomorrow's critical morning peak
-        api_event = {
-            "offre": "CPC-D",
-            "datedebut": "2024-12-11T06:00:00-05:00",
-            "datefin": "2024-12-11T10:00:00-05:00",
-            "plagehoraire": "AM",
-            "duree": "PT04H00MS",
-            "secteurclient": "Résidentiel",
-        }
+        api_event = _make_event(datetime.date(2024, 12, 11), "AM")
         dcpc_handler.load_events([api_event])
 
         # Tomorrow morning should be critical (from API)
@@ -9,38 +9,167 @@ Tests verify:
 """
 
 import datetime
+import zoneinfo
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
 
 import pytest
-from freezegun import freeze_time
 
+from custom_components.hydroqc.public_data import peak_handler as peak_handler_module
 from custom_components.hydroqc.public_data_client import PeakHandler
 
-
+EST_TIMEZONE = zoneinfo.ZoneInfo("America/Toronto")
+EST_OFFSET = datetime.timedelta(hours=-5)
+EDT_OFFSET = datetime.timedelta(hours=-4)
+
+# Fields shared by every Flex-D API announcement
+_BASE_DPC_EVENT = {
+    "offre": "TPC-DPC",
+    "duree": "PT04H00MS",
+    "secteurclient": "Résidentiel",
+}
+
+
+def _dpc_event(start: str, end: str, time_slot: str) -> Mapping[str, str]:
+    """Build a read-only Flex-D API event for the given period."""
+    return MappingProxyType(
+        {**_BASE_DPC_EVENT, "datedebut": start, "datefin": end, "plagehoraire": time_slot}
+    )
+
+
+# API events shared across tests, built once at import
+_DEC5_AM_PEAK = _dpc_event("2024-12-05T06:00:00-05:00", "2024-12-05T10:00:00-05:00", "AM")
+_DEC5_PM_PEAK = _dpc_event("2024-12-05T16:00:00-05:00", "2024-12-05T20:00:00-05:00", "PM")
+_DEC6_AM_PEAK = _dpc_event("2024-12-06T06:00:00-05:00", "2024-12-06T10:00:00-05:00", "AM")
+_DEC10_AM_PEAK = _dpc_event("2024-12-10T06:00:00-05:00", "2024-12-10T10:00:00-05:00", "AM")
+_MAR5_PM_PEAK = _dpc_event("2025-03-05T16:00:00-05:00", "2025-03-05T20:00:00-05:00", "PM")
+# EDT (after the DST transition)
+_MAR9_PM_PEAK = _dpc_event("2025-03-09T16:00:00-04:00", "2025-03-09T20:00:00-04:00", "PM")
+# 6 AM EST to 10 AM EDT, spanning the DST transition
+_MAR9_DST_SPANNING_PEAK = _dpc_event("2025-03-09T06:00:00-05:00", "2025-03-09T10:00:00-04:00", "AM")
+_MAR31_AM_PEAK = _dpc_event("2025-03-31T06:00:00-04:00", "2025-03-31T10:00:00-04:00", "AM")
+
+# Pinned clock instants, in local time so EST/EDT offsets follow the DST rules
+_DEC2_1000 = datetime.datetime(2024, 12, 2, 10, 0, tzinfo=EST_TIMEZONE)
+_DEC5_1000 = datetime.datetime(2024, 12, 5, 10, 0, tzinfo=EST_TIMEZONE)
+_DEC10_0300 = datetime.datetime(2024, 12, 10, 3, 0, tzinfo=EST_TIMEZONE)
+_DEC10_0430 = datetime.datetime(2024, 12, 10, 4, 30, tzinfo=EST_TIMEZONE)
+_DEC10_0530 = datetime.datetime(2024, 12, 10, 5, 30, tzinfo=EST_TIMEZONE)
+_DEC10_0700 = datetime.datetime(2024, 12, 10, 7, 0, tzinfo=EST_TIMEZONE)
+_MAR5_1000 = datetime.datetime(2025, 3, 5, 10, 0, tzinfo=EST_TIMEZONE)
+_MAR9_0130 = datetime.datetime(2025, 3, 9, 1, 30, tzinfo=EST_TIMEZONE)
+_MAR9_1000 = datetime.datetime(2025, 3, 9, 10, 0, tzinfo=EST_TIMEZONE)
+_MAR25_1000 = datetime.datetime(2025, 3, 25, 10, 0, tzinfo=EST_TIMEZONE)
+_MAR30_1000 = datetime.datetime(2025, 3, 30, 10, 0, tzinfo=EST_TIMEZONE)
+_APR15_1200 = datetime.datetime(2025, 4, 15, 12, 0, tzinfo=EST_TIMEZONE)
+_JUN15_1200 = datetime.datetime(2025, 6, 15, 12, 0, tzinfo=EST_TIMEZONE)
+_OCT1_1200 = datetime.datetime(2025, 10, 1, 12, 0, tzinfo=EST_TIMEZONE)
+
+# Handler properties exposing each DPC peak period
+_PEAK_PERIODS = (
+    "today_morning_peak",
+    "today_evening_peak",
+    "tomorrow_morning_peak",
+    "tomorrow_evening_peak",
+)
+
+# Last day of the 2024-2025 winter season
+_LAST_WINTER_DAY = datetime.date(2025, 3, 31)
+
+
+def _assert_all_critical(handler: PeakHandler, count: int) -> None:
+    """Assert the handler loaded `count` events, all critical (DPC's invariant)."""
+    events = handler._events
+    assert len(events) == count
+    assert all(event.is_critical for event in events)
+
+
+# Keep the class on one xdist worker so its shared handlers are built once
+@pytest.mark.xdist_group(name="dpc_peaks")
 class TestDPCPeakBehavior:
     """Test DPC (Flex-D) peak behavior."""
 
-    @pytest.fixture
-    def dpc_handler(self) -> PeakHandler:
-        """Create DPC PeakHandler."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def dpc_handler(cls) -> PeakHandler:
+        """Create DPC PeakHandler shared by all tests in the class."""
         return PeakHandler(rate_code="DPC", preheat_duration=120)
 
+    @pytest.fixture(scope="class")
+    @classmethod
+    def dpc_handler_60min(cls) -> PeakHandler:
+        """Create DPC PeakHandler with a 60-minute preheat, shared by the class."""
+        return PeakHandler(rate_code="DPC", preheat_duration=60)
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def dec10_handler(cls) -> PeakHandler:
+        """Create DPC PeakHandler with the Dec 10 morning peak loaded once for the class."""
+        handler = PeakHandler(rate_code="DPC", preheat_duration=120)
+        handler.load_events([_DEC10_AM_PEAK])
+        return handler
+
+    @pytest.fixture(autouse=True)
+    def reset_handlers(self, dpc_handler: PeakHandler, dpc_handler_60min: PeakHandler) -> None:
+        """Start each test from empty shared handlers (dec10_handler keeps its peak)."""
+        dpc_handler.load_events([])
+        dpc_handler_60min.load_events([])
+
+    @pytest.fixture
+    def set_now(self, monkeypatch: pytest.MonkeyPatch) -> Callable[[datetime.datetime], None]:
+        """Pin the PeakHandler clock to a fixed local datetime."""
+
+        def _set_now(now: datetime.datetime) -> None:
+            monkeypatch.setattr(peak_handler_module, "_now", lambda: now)
+
+        return _set_now
+
     # ========================================================================
-    # OUTSIDE WINTER SEASON TESTS
+    # NO API EVENTS
     # ========================================================================
 
-    @freeze_time("2025-06-15T12:00:00-04:00")  # Summer - outside winter season
-    def test_outside_winter_no_events(self, dpc_handler: PeakHandler) -> None:
-        """Test DPC outside winter season with no API events."""
-        # No API events
+    @pytest.mark.parametrize(
+        ("now", "expected_state"),
+        [
+            pytest.param(_JUN15_1200, "off_season", id="summer"),
+            pytest.param(_OCT1_1200, "off_season", id="october"),
+            pytest.param(_APR15_1200, "off_season", id="april"),
+            pytest.param(_DEC2_1000, "normal", id="winter_start"),
+            pytest.param(_MAR5_1000, "normal", id="winter_end_before_dst"),
+            pytest.param(_MAR9_1000, "normal", id="winter_end_dst_day"),
+            pytest.param(_MAR25_1000, "normal", id="winter_end_after_dst"),
+        ],
+    )
+    def test_no_api_events_any_season(
+        self,
+        dpc_handler: PeakHandler,
+        set_now: Callable[[datetime.datetime], None],
+        now: datetime.datetime,
+        expected_state: str,
+    ) -> None:
+        """Test DPC with no API events, in and out of the winter season."""
+        set_now(now)
+
         dpc_handler.load_events([])
 
-        # No events should exist
+        # DPC has no schedule generation - only API events
         assert len(dpc_handler._events) == 0
-        assert dpc_handler.current_state == "off_season"
+        assert dpc_handler.today_morning_peak is None
+        assert dpc_handler.today_evening_peak is None
+        assert dpc_handler.next_peak is None
+        # No events in winter = "normal" (matches hydroqc2mqtt behavior)
+        assert dpc_handler.current_state == expected_state
+
+    # ========================================================================
+    # OUTSIDE WINTER SEASON TESTS
+    # ========================================================================
 
-    @freeze_time("2025-06-15T12:00:00-04:00")  # Summer
-    def test_outside_winter_binary_sensors_false(self, dpc_handler: PeakHandler) -> None:
+    def test_outside_winter_binary_sensors_false(
+        self, dpc_handler: PeakHandler, set_now: Callable[[datetime.datetime], None]
+    ) -> None:
         """Test that binary sensors return False (not None) outside winter."""
+        set_now(_JUN15_1200)  # Summer
+
         dpc_handler.load_events([])
 
         # All peak-related properties should be None
@@ -53,358 +182,210 @@ class TestDPCPeakBehavior:
 
         # coordinator.get_sensor_value() will return False for .is_critical when object is None
 
-    @freeze_time("2025-10-01T12:00:00-04:00")  # October
-    def test_october_outside_winter(self, dpc_handler: PeakHandler) -> None:
-        """Test October (before winter starts)."""
-        dpc_handler.load_events([])
-        assert len(dpc_handler._events) == 0
-
-    @freeze_time("2025-04-15T12:00:00-04:00")  # April
-    def test_april_after_winter_ends(self, dpc_handler: PeakHandler) -> None:
-        """Test April (after winter ends)."""
-        dpc_handler.load_events([])
-        assert len(dpc_handler._events) == 0
-
-    # ========================================================================
-    # BEGINNING OF WINTER - NO CRITICAL PEAKS
-    # ========================================================================
-
-    @freeze_time("2024-12-02T10:00:00-05:00")  # Dec 2, 2024 - start of winter
-    def test_beginning_winter_no_critical_peaks(self, dpc_handler: PeakHandler) -> None:
-        """Test beginning of winter with no API announcements."""
-        # No API events
-        dpc_handler.load_events([])
-
-        # DPC has no schedule generation - only API events
-        assert len(dpc_handler._events) == 0
-
-        # All properties should be None
-        assert dpc_handler.today_morning_peak is None
-        assert dpc_handler.today_evening_peak is None
-        assert dpc_handler.next_peak is None
-        # No events = "normal" (matches hydroqc2mqtt behavior)
-        assert dpc_handler.current_state == "normal"
-
     # ========================================================================
     # BEGINNING OF WINTER - WITH CRITICAL PEAKS
     # ========================================================================
 
-    @freeze_time("2024-12-05T10:00:00-05:00")  # Dec 5, 2024
-    def test_beginning_winter_with_critical_morning_peak(self, dpc_handler: PeakHandler) -> None:
-        """Test beginning of winter with API announcing critical morning peak."""
-        # API announces critical morning peak for today
-        api_event = {
-            "offre": "TPC-DPC",
-            "datedebut": "2024-12-05T06:00:00-05:00",
-            "datefin": "2024-12-05T10:00:00-05:00",
-            "plagehoraire": "AM",
-            "duree": "PT04H00MS",
-            "secteurclient": "Résidentiel",
-        }
-
+    @pytest.mark.parametrize(
+        ("api_event", "period", "start_hour", "end_hour"),
+        [
+            pytest.param(_DEC5_AM_PEAK, "today_morning_peak", 6, 10, id="morning"),
+            pytest.param(_DEC5_PM_PEAK, "today_evening_peak", 16, 20, id="evening"),
+        ],
+    )
+    def test_beginning_winter_with_critical_peak(
+        self,
+        dpc_handler: PeakHandler,
+        set_now: Callable[[datetime.datetime], None],
+        api_event: Mapping[str, str],
+        period: str,
+        start_hour: int,
+        end_hour: int,
+    ) -> None:
+        """Test beginning of winter with API announcing a single critical peak."""
+        set_now(_DEC5_1000)  # Dec 5, 2024
+
+        # API announces critical peak for today
         dpc_handler.load_events([api_event])
 
-        # Should have exactly 1 event from API
-        assert len(dpc_handler._events) == 1
-
-        # Event should be critical
-        assert dpc_handler._events[0].is_critical is True
+        # Should have exactly 1 event from API, and it should be critical
+        _assert_all_critical(dpc_handler, 1)
 
-        # Today morning should be critical
-        today_morning = dpc_handler.today_morning_peak
-        assert today_morning is not None
-        assert today_morning.is_critical is True
-        assert today_morning.start_date.hour == 6
-        assert today_morning.end_date.hour == 10
+        # The announced period should be critical
+        peak = getattr(dpc_handler, period)
+        assert peak is not None
+        assert peak.is_critical is True
+        assert peak.start_date.hour == start_hour
+        assert peak.end_date.hour == end_hour
 
         # Other periods should be None (not announced)
-        assert dpc_handler.today_evening_peak is None
-        assert dpc_handler.tomorrow_morning_peak is None
-        assert dpc_handler.tomorrow_evening_peak is None
+        for other_period in _PEAK_PERIODS:
+            if other_period != period:
+                assert getattr(dpc_handler, other_period) is None
 
-    @freeze_time("2024-12-05T10:00:00-05:00")  # Dec 5, 2024
-    def test_beginning_winter_multiple_critical_peaks(self, dpc_handler: PeakHandler) -> None:
+    def test_beginning_winter_multiple_critical_peaks(
+        self, dpc_handler: PeakHandler, set_now: Callable[[datetime.datetime], None]
+    ) -> None:
         """Test beginning of winter with multiple critical peaks announced."""
+        set_now(_DEC5_1000)  # Dec 5, 2024
+
         # API announces multiple critical peaks
-        api_events = [
-            {
-                "offre": "TPC-DPC",
-                "datedebut": "2024-12-05T16:00:00-05:00",
-                "datefin": "2024-12-05T20:00:00-05:00",
-                "plagehoraire": "PM",
-                "duree": "PT04H00MS",
-                "secteurclient": "Résidentiel",
-            },
-            {
-                "offre": "TPC-DPC",
-                "datedebut": "2024-12-06T06:00:00-05:00",
-                "datefin": "2024-12-06T10:00:00-05:00",
-                "plagehoraire": "AM",
-                "duree": "PT04H00MS",
-                "secteurclient": "Résidentiel",
-            },
-        ]
-
-        dpc_handler.load_events(api_events)
+        dpc_handler.load_events([_DEC5_PM_PEAK, _DEC6_AM_PEAK])
 
         # Should have 2 events, both critical
-        assert len(dpc_handler._events) == 2
-        assert all(e.is_critical for e in dpc_handler._events)
+        _assert_all_critical(dpc_handler, 2)
 
         # Verify specific peaks
         assert dpc_handler.today_morning_peak is None  # Not announced
-        assert dpc_handler.today_evening_peak is not None
-        assert dpc_handler.today_evening_peak.is_critical is True
+        today_evening = dpc_handler.today_evening_peak
+        assert today_evening is not None
+        assert today_evening.is_critical is True
 
-        assert dpc_handler.tomorrow_morning_peak is not None
-        assert dpc_handler.tomorrow_morning_peak.is_critical is True
+        tomorrow_morning = dpc_handler.tomorrow_morning_peak
+        assert tomorrow_morning is not None
+        assert tomorrow_morning.is_critical is True
         assert dpc_handler.tomorrow_evening_peak is None  # Not announced
 
     # ========================================================================
     # END OF WINTER - BEFORE DST
     # ========================================================================
 
-    @freeze_time("2025-03-05T10:00:00-05:00")  # March 5, 2025 (before DST on March 9)
-    def test_end_winter_before_dst_no_critical(self, dpc_handler: PeakHandler) -> None:
-        """Test end of winter before DST with no critical peaks."""
-        dpc_handler.load_events([])
-
-        # No events (only API announcements)
-        assert len(dpc_handler._events) == 0
-        assert dpc_handler.next_peak is None
-
-    @freeze_time("2025-03-05T10:00:00-05:00")  # March 5, 2025
-    def test_end_winter_before_dst_with_critical(self, dpc_handler: PeakHandler) -> None:
+    def test_end_winter_before_dst_with_critical(
+        self, dpc_handler: PeakHandler, set_now: Callable[[datetime.datetime], None]
+    ) -> None:
         """Test end of winter before DST with critical peak."""
-        api_event = {
-            "offre": "TPC-DPC",
-            "datedebut": "2025-03-05T16:00:00-05:00",
-            "datefin": "2025-03-05T20:00:00-05:00",
-            "plagehoraire": "PM",
-            "duree": "PT04H00MS",
-            "secteurclient": "Résidentiel",
-        }
+        set_now(_MAR5_1000)  # March 5, 2025
 
-        dpc_handler.load_events([api_event])
+        dpc_handler.load_events([_MAR5_PM_PEAK])
 
-        assert len(dpc_handler._events) == 1
+        _assert_all_critical(dpc_handler, 1)
         today_evening = dpc_handler.today_evening_peak
         assert today_evening is not None
         assert today_evening.is_critical is True
-        assert today_evening.start_date.strftime("%z") == "-0500"  # EST
+        assert today_evening.start_date.utcoffset() == EST_OFFSET
 
     # ========================================================================
     # END OF WINTER - DURING DST TRANSITION
     # ========================================================================
 
-    @freeze_time("2025-03-09T10:00:00-04:00")  # March 9, 2025 - DST day (after 2 AM transition)
-    def test_end_winter_dst_day_no_critical(self, dpc_handler: PeakHandler) -> None:
-        """Test DST transition day with no critical peaks."""
-        dpc_handler.load_events([])
-        assert len(dpc_handler._events) == 0
-
-    @freeze_time("2025-03-09T10:00:00-04:00")  # March 9, 2025 - DST day
-    def test_end_winter_dst_day_with_critical(self, dpc_handler: PeakHandler) -> None:
+    def test_end_winter_dst_day_with_critical(
+        self, dpc_handler: PeakHandler, set_now: Callable[[datetime.datetime], None]
+    ) -> None:
         """Test DST day with critical peak spanning DST transition."""
-        # Peak that would start before DST but is announced in EDT
-        api_event = {
-            "offre": "TPC-DPC",
-            "datedebut": "2025-03-09T16:00:00-04:00",  # EDT (after transition)
-            "datefin": "2025-03-09T20:00:00-04:00",
-            "plagehoraire": "PM",
-            "duree": "PT04H00MS",
-            "secteurclient": "Résidentiel",
-        }
+        set_now(_MAR9_1000)  # March 9, 2025 - DST day
 
-        dpc_handler.load_events([api_event])
+        # Peak that would start before DST but is announced in EDT
+        dpc_handler.load_events([_MAR9_PM_PEAK])
 
         today_evening = dpc_handler.today_evening_peak
         assert today_evening is not None
         assert today_evening.is_critical is True
-        assert today_evening.start_date.strftime("%z") == "-0400"  # EDT
+        assert today_evening.start_date.utcoffset() == EDT_OFFSET
 
-    @freeze_time("2025-03-09T01:30:00-05:00")  # March 9 at 1:30 AM (before DST at 2 AM)
-    def test_peak_during_dst_transition_hour(self, dpc_handler: PeakHandler) -> None:
+    def test_peak_during_dst_transition_hour(
+        self, dpc_handler: PeakHandler, set_now: Callable[[datetime.datetime], None]
+    ) -> None:
         """Test peak event that starts before DST and ends after DST.
 
         Note: DST happens at 2 AM EST → 3 AM EDT on March 9, 2025.
         Testing at 1:30 AM EST (before transition).
         """
-        # Peak from 6 AM EST to 10 AM EDT (spans DST transition indirectly)
-        api_event = {
-            "offre": "TPC-DPC",
-            "datedebut": "2025-03-09T06:00:00-05:00",  # 6 AM EST
-            "datefin": "2025-03-09T10:00:00-04:00",  # 10 AM EDT
-            "plagehoraire": "AM",
-            "duree": "PT04H00MS",
-            "secteurclient": "Résidentiel",
-        }
+        set_now(_MAR9_0130)  # March 9 at 1:30 AM (before DST at 2 AM)
 
-        dpc_handler.load_events([api_event])
+        # Peak from 6 AM EST to 10 AM EDT (spans DST transition indirectly)
+        dpc_handler.load_events([_MAR9_DST_SPANNING_PEAK])
 
-        # Verify event was loaded
-        assert len(dpc_handler._events) == 1
+        # Verify event was loaded as critical
+        _assert_all_critical(dpc_handler, 1)
         peak = dpc_handler._events[0]
-        assert peak.is_critical is True
 
         # Verify timezone handling: start in EST, end in EDT
-        assert peak.start_date.strftime("%z") == "-0500"
-        assert peak.end_date.strftime("%z") == "-0400"
+        assert peak.start_date.utcoffset() == EST_OFFSET
+        assert peak.end_date.utcoffset() == EDT_OFFSET
 
     # ========================================================================
     # END OF WINTER - AFTER DST
     # ========================================================================
 
-    @freeze_time("2025-03-25T10:00:00-04:00")  # March 25, 2025 (after DST)
-    def test_end_winter_after_dst_no_critical(self, dpc_handler: PeakHandler) -> None:
-        """Test end of winter after DST with no peaks."""
-        dpc_handler.load_events([])
-        assert len(dpc_handler._events) == 0
-
-    @freeze_time("2025-03-30T10:00:00-04:00")  # March 30, 2025 - near end of season
-    def test_last_days_winter_with_critical(self, dpc_handler: PeakHandler) -> None:
+    def test_last_days_winter_with_critical(
+        self, dpc_handler: PeakHandler, set_now: Callable[[datetime.datetime], None]
+    ) -> None:
         """Test last days of winter season with critical peak."""
-        # Critical peak on tomorrow (Mar 31, last day of winter)
-        api_event = {
-            "offre": "TPC-DPC",
-            "datedebut": "2025-03-31T06:00:00-04:00",
-            "datefin": "2025-03-31T10:00:00-04:00",
-            "plagehoraire": "AM",
-            "duree": "PT04H00MS",
-            "secteurclient": "Résidentiel",
-        }
+        set_now(_MAR30_1000)  # March 30, 2025 - near end of season
 
-        dpc_handler.load_events([api_event])
+        # Critical peak on tomorrow (Mar 31, last day of winter)
+        dpc_handler.load_events([_MAR31_AM_PEAK])
 
         tomorrow_morning = dpc_handler.tomorrow_morning_peak
         assert tomorrow_morning is not None
         assert tomorrow_morning.is_critical is True
-        assert tomorrow_morning.start_date.date() == datetime.date(2025, 3, 31)
-        assert tomorrow_morning.start_date.strftime("%z") == "-0400"  # EDT
+        assert tomorrow_morning.start_date.date() == _LAST_WINTER_DAY
+        assert tomorrow_morning.start_date.utcoffset() == EDT_OFFSET
 
     # ========================================================================
     # PREHEAT PERIOD TESTS
     # ========================================================================
 
-    @freeze_time("2024-12-10T04:30:00-05:00")  # Dec 10 at 4:30 AM (during preheat before 6 AM peak)
-    def test_preheat_period_before_peak(self, dpc_handler: PeakHandler) -> None:
+    def test_preheat_period_before_peak(
+        self, dec10_handler: PeakHandler, set_now: Callable[[datetime.datetime], None]
+    ) -> None:
         """Test preheat period detection before peak."""
-        # Peak at 6-10 AM
-        api_event = {
-            "offre": "TPC-DPC",
-            "datedebut": "2024-12-10T06:00:00-05:00",
-            "datefin": "2024-12-10T10:00:00-05:00",
-            "plagehoraire": "AM",
-            "duree": "PT04H00MS",
-            "secteurclient": "Résidentiel",
-        }
-
-        dpc_handler.load_events([api_event])
+        set_now(_DEC10_0430)  # Dec 10 at 4:30 AM (during preheat before 6 AM peak)
 
         # Before peak starts (2 hours before peak)
         # Note: hydroqc2mqtt doesn't have 'preheat' state, returns 'normal'
-        assert dpc_handler.current_state == "normal"
-        assert dpc_handler.current_peak is None  # Peak hasn't started yet
+        assert dec10_handler.current_state == "normal"
+        assert dec10_handler.current_peak is None  # Peak hasn't started yet
 
-    @freeze_time("2024-12-10T07:00:00-05:00")  # Dec 10 at 7 AM (during peak)
-    def test_during_peak_no_preheat(self, dpc_handler: PeakHandler) -> None:
+    def test_during_peak_no_preheat(
+        self, dec10_handler: PeakHandler, set_now: Callable[[datetime.datetime], None]
+    ) -> None:
         """Test that preheat is not active during peak."""
-        api_event = {
-            "offre": "TPC-DPC",
-            "datedebut": "2024-12-10T06:00:00-05:00",
-            "datefin": "2024-12-10T10:00:00-05:00",
-            "plagehoraire": "AM",
-            "duree": "PT04H00MS",
-            "secteurclient": "Résidentiel",
-        }
-
-        dpc_handler.load_events([api_event])
+        set_now(_DEC10_0700)  # Dec 10 at 7 AM (during peak)
 
         # During peak
-        assert dpc_handler.peak_in_progress is True
-        assert dpc_handler.current_state == "critical_peak"
-        assert dpc_handler.current_peak is not None
-        assert dpc_handler.current_peak_is_critical is True
-
-    @freeze_time("2024-12-10T03:00:00-05:00")  # Dec 10 at 3 AM (before preheat)
-    def test_before_preheat_regular_period(self, dpc_handler: PeakHandler) -> None:
+        assert dec10_handler.peak_in_progress is True
+        assert dec10_handler.current_state == "critical_peak"
+        assert dec10_handler.current_peak is not None
+        assert dec10_handler.current_peak_is_critical is True
+
+    def test_before_preheat_regular_period(
+        self, dec10_handler: PeakHandler, set_now: Callable[[datetime.datetime], None]
+    ) -> None:
         """Test regular period before preheat starts."""
-        api_event = {
-            "offre": "TPC-DPC",
-            "datedebut": "2024-12-10T06:00:00-05:00",
-            "datefin": "2024-12-10T10:00:00-05:00",
-            "plagehoraire": "AM",
-            "duree": "PT04H00MS",
-            "secteurclient": "Résidentiel",
-        }
-
-        dpc_handler.load_events([api_event])
+        set_now(_DEC10_0300)  # Dec 10 at 3 AM (before preheat)
 
-        assert dpc_handler.peak_in_progress is False
-        assert dpc_handler.current_state == "normal"
+        assert dec10_handler.peak_in_progress is False
+        assert dec10_handler.current_state == "normal"
 
     # ========================================================================
     # CONFIGURABLE PREHEAT DURATION TESTS
     # ========================================================================
 
-    @freeze_time("2024-12-10T05:30:00-05:00")  # Dec 10 at 5:30 AM
-    def test_custom_preheat_duration_60_minutes(self) -> None:
-        """Test 60-minute preheat duration."""
-        handler = PeakHandler(rate_code="DPC", preheat_duration=60)
+    def test_preheat_60min_boundary(
+        self, dpc_handler_60min: PeakHandler, set_now: Callable[[datetime.datetime], None]
+    ) -> None:
+        """Test 60-minute preheat before and after preheat starts."""
+        set_now(_DEC10_0430)  # Dec 10 at 4:30 AM
 
-        api_event = {
-            "offre": "TPC-DPC",
-            "datedebut": "2024-12-10T06:00:00-05:00",
-            "datefin": "2024-12-10T10:00:00-05:00",
-            "plagehoraire": "AM",
-            "duree": "PT04H00MS",
-            "secteurclient": "Résidentiel",
-        }
+        dpc_handler_60min.load_events([_DEC10_AM_PEAK])
 
-        handler.load_events([api_event])
+        # At 4:30 AM, 90 minutes before peak
+        # With 60-minute preheat, we should NOT be in preheat yet
+        assert dpc_handler_60min.preheat_in_progress is False
 
         # At 5:30 AM, 30 minutes before peak
         # With 60-minute preheat, we should be in preheat period
-        assert handler.preheat_in_progress is True
-
-    @freeze_time("2024-12-10T04:30:00-05:00")  # Dec 10 at 4:30 AM
-    def test_custom_preheat_duration_60_minutes_before_preheat(self) -> None:
-        """Test 60-minute preheat - before preheat starts."""
-        handler = PeakHandler(rate_code="DPC", preheat_duration=60)
-
-        api_event = {
-            "offre": "TPC-DPC",
-            "datedebut": "2024-12-10T06:00:00-05:00",
-            "datefin": "2024-12-10T10:00:00-05:00",
-            "plagehoraire": "AM",
-            "duree": "PT04H00MS",
-            "secteurclient": "Résidentiel",
-        }
-
-        handler.load_events([api_event])
-
-        # At 4:30 AM, 90 minutes before peak
-        # With 60-minute preheat, we should NOT be in preheat yet
-        assert handler.preheat_in_progress is False
+        set_now(_DEC10_0530)  # Same handler, clock moved forward
+        assert dpc_handler_60min.preheat_in_progress is True
 
     # ========================================================================
     # TIMEZONE AWARENESS
     # ========================================================================
 
-    @freeze_time("2024-12-10T10:00:00-05:00")
-    def test_timezone_awareness(self, dpc_handler: PeakHandler) -> None:
+    def test_timezone_awareness(self, dec10_handler: PeakHandler) -> None:
         """Test that all DPC event datetimes are timezone-aware."""
-        api_event = {
-            "offre": "TPC-DPC",
-            "datedebut": "2024-12-10T06:00:00-05:00",
-            "datefin": "2024-12-10T10:00:00-05:00",
-            "plagehoraire": "AM",
-            "duree": "PT04H00MS",
-            "secteurclient": "Résidentiel",
-        }
-
-        dpc_handler.load_events([api_event])
-        event = dpc_handler._events[0]
+        event = dec10_handler._events[0]
 
         # All dates should be timezone-aware
         assert event.start_date.tzinfo is not None
@@ -413,28 +394,16 @@ class TestDPCPeakBehavior:
         assert event.preheat.end_date.tzinfo is not None
 
         # Check UTC offset is correct for EST (-05:00)
-        assert event.start_date.strftime("%z") == "-0500"
-        assert event.end_date.strftime("%z") == "-0500"
+        assert event.start_date.utcoffset() == EST_OFFSET
+        assert event.end_date.utcoffset() == EST_OFFSET
 
     # ========================================================================
     # NO ANCHOR PERIODS FOR DPC
     # ========================================================================
 
-    @freeze_time("2024-12-10T10:00:00-05:00")
-    def test_dpc_peaks_have_no_anchors(self, dpc_handler: PeakHandler) -> None:
+    def test_dpc_peaks_have_no_anchors(self, dec10_handler: PeakHandler) -> None:
         """Test that DPC peaks do not have anchor periods (those are only for DCPC)."""
-        api_event = {
-            "offre": "TPC-DPC",
-            "datedebut": "2024-12-10T06:00:00-05:00",
-            "datefin": "2024-12-10T10:00:00-05:00",
-            "plagehoraire": "AM",
-            "duree": "PT04H00MS",
-            "secteurclient": "Résidentiel",
-        }
-
-        dpc_handler.load_events([api_event])
-
-        peak = dpc_handler._events[0]
+        peak = dec10_handler._events[0]
 
         # DPC peaks should have anchor property, but it's only meaningful for DCPC
         # The anchor property exists on PeakEvent but is a DCPC-specific feature
@@ -1,59 +1,125 @@
 """Unit tests for calendar_manager module."""
 
+from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock, patch
-from zoneinfo import ZoneInfo
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from freezegun import freeze_time
+from homeassistant.components.calendar import CalendarEntity
 
 from custom_components.hydroqc import calendar_manager
 from custom_components.hydroqc.public_data_client import PeakEvent
+from custom_components.hydroqc.utils import TZ as EST
 
-# Timezone constant
-EST = ZoneInfo("America/Toronto")
+# Fixed "now" for the module: peaks are built relative to it and sync filters on it
+_FROZEN_NOW = "2025-01-15T12:00:00-05:00"
 
+# UTC offset suffixes of a UID built from an America/Toronto start (EST, EDT)
+_EASTERN_OFFSETS = frozenset({"-05:00", "-04:00"})
 
-@pytest.fixture
+# Calendar service failure injected by the failure tests
+_SERVICE_FAIL = RuntimeError("Service call failed")
+
+# Async tests share the module event loop, like the module-scoped fixtures they use
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+
+@pytest.fixture(scope="module", autouse=True)
+def frozen_now() -> Iterator[None]:
+    """Freeze the clock for the whole module, module-scoped peak fixtures included."""
+    with freeze_time(_FROZEN_NOW):
+        yield
+
+
+@pytest.fixture(scope="module")
 def mock_hass() -> MagicMock:
-    """Create a mock Home Assistant instance."""
+    """Create a mock Home Assistant instance shared by the module (no calendar loaded)."""
     hass = MagicMock()
     hass.services = MagicMock()
     hass.services.async_call = AsyncMock()
+    hass.data = {}
     return hass
 
 
+@pytest.fixture(autouse=True)
+def reset_mock_hass(mock_hass: MagicMock) -> Iterator[None]:
+    """Drop calls, side effects and registered calendars left by the previous test."""
+    yield
+    mock_hass.reset_mock(return_value=True, side_effect=True)
+    mock_hass.services.async_call = AsyncMock()
+    mock_hass.data = {}
+
+
+@pytest.fixture(autouse=True)
+def mock_sleep(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    """Skip the real delay between calendar event creations."""
+    sleep = AsyncMock()
+    monkeypatch.setattr(calendar_manager.asyncio, "sleep", sleep)
+    return sleep
+
+
 @pytest.fixture
-def sample_critical_peak() -> PeakEvent:
-    """Create a sample critical peak event (tomorrow)."""
-    start = datetime.now(EST) + timedelta(days=1)
-    start = start.replace(hour=6, minute=0, second=0, microsecond=0)
+def make_calendar_entity(mock_hass: MagicMock) -> Callable[..., MagicMock]:
+    """Register a mock calendar.test entity on mock_hass, returning the given events."""
+
+    def _make_calendar_entity(
+        events: Iterable[object] = (), error: Exception | None = None
+    ) -> MagicMock:
+        entity = MagicMock(spec=CalendarEntity)
+        entity.entity_id = "calendar.test"
+        entity.async_get_events = AsyncMock(return_value=list(events), side_effect=error)
+
+        component = MagicMock()
+        component.entities = [entity]
+        mock_hass.data = {"calendar": component}
+        return entity
+
+    return _make_calendar_entity
+
+
+def _peak(
+    days: int, hour: int, *, critical: bool, slot: str = "AM", offer: str = "CPC-D"
+) -> PeakEvent:
+    """Build a 4-hour peak event starting at `hour`, `days` from today."""
+    midnight = datetime.now(EST).replace(hour=0, minute=0, second=0, microsecond=0)
+    start = midnight + timedelta(days=days, hours=hour)
     end = start + timedelta(hours=4)
     data = {
-        "offre": "CPC-D",
+        "offre": offer,
         "datedebut": start.isoformat(),
         "datefin": end.isoformat(),
-        "plagehoraire": "AM",
+        "plagehoraire": slot,
         "duree": "PT04H00MS",
         "secteurclient": "Résidentiel",
     }
-    return PeakEvent(data, preheat_duration=120, force_critical=True)
+    return PeakEvent(data, preheat_duration=120, force_critical=critical)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def sample_critical_peak() -> PeakEvent:
+    """Create a sample critical peak event (tomorrow), shared by the module."""
+    return _peak(1, 6, critical=True)
+
+
+@pytest.fixture(scope="module")
 def sample_regular_peak() -> PeakEvent:
-    """Create a sample regular (non-critical) peak event (day after tomorrow)."""
-    start = datetime.now(EST) + timedelta(days=2)
-    start = start.replace(hour=16, minute=0, second=0, microsecond=0)
-    end = start + timedelta(hours=4)
-    data = {
-        "offre": "CPC-D",
-        "datedebut": start.isoformat(),
-        "datefin": end.isoformat(),
-        "plagehoraire": "PM",
-        "duree": "PT04H00MS",
-        "secteurclient": "Résidentiel",
-    }
-    return PeakEvent(data, preheat_duration=120, force_critical=False)
+    """Create a sample non-critical peak event (day after tomorrow), shared by the module."""
+    return _peak(2, 16, critical=False, slot="PM")
+
+
+@pytest.fixture(scope="module")
+def past_critical_peak() -> PeakEvent:
+    """Create a critical peak event that already ended (yesterday), shared by the module."""
+    return _peak(-1, 6, critical=True)
+
+
+@pytest.fixture(scope="module")
+def dpc_critical_peak() -> PeakEvent:
+    """Create a critical DPC peak event (tomorrow afternoon), shared by the module."""
+    # All DPC API events are critical
+    return _peak(1, 14, critical=True, slot="PM", offer="TPC-DPC")
 
 
 def test_generate_event_uid_stability() -> None:
@@ -88,10 +154,9 @@ def test_generate_event_uid_preserves_timezone() -> None:
     uid = calendar_manager.generate_event_uid(contract_id, peak_start)
 
     # Check that timezone offset is included
-    assert "-05:00" in uid or "-04:00" in uid  # EST or EDT
+    assert uid[-6:] in _EASTERN_OFFSETS
 
 
-@pytest.mark.asyncio
 async def test_create_peak_event_critical(
     mock_hass: MagicMock, sample_critical_peak: PeakEvent
 ) -> None:
@@ -126,7 +191,6 @@ async def test_create_peak_event_critical(
     assert call_args.kwargs["blocking"] is True
 
 
-@pytest.mark.asyncio
 async def test_create_peak_event_non_critical_still_uses_critical_title(
     mock_hass: MagicMock, sample_regular_peak: PeakEvent
 ) -> None:
@@ -149,14 +213,13 @@ async def test_create_peak_event_non_critical_still_uses_critical_title(
     assert "uid" not in service_data  # UID field not supported by HA calendar service
 
 
-@pytest.mark.asyncio
 async def test_create_peak_event_service_failure(
     mock_hass: MagicMock, sample_critical_peak: PeakEvent
 ) -> None:
     """Test handling of service call failure."""
-    mock_hass.services.async_call.side_effect = Exception("Service call failed")
+    mock_hass.services.async_call.side_effect = _SERVICE_FAIL
 
-    with pytest.raises(Exception, match="Service call failed"):
+    with pytest.raises(RuntimeError, match="Service call failed"):
         await calendar_manager.async_create_peak_event(
             mock_hass,
             "calendar.test",
@@ -167,25 +230,31 @@ async def test_create_peak_event_service_failure(
         )
 
 
-@pytest.mark.asyncio
-async def test_sync_events_creates_future_events_only(
-    mock_hass: MagicMock, sample_critical_peak: PeakEvent, sample_regular_peak: PeakEvent
+@pytest.mark.parametrize(
+    ("peak_fixtures", "rate", "expected_created"),
+    [
+        pytest.param((), "DCPC", 0, id="empty_list"),
+        pytest.param(
+            ("sample_critical_peak", "sample_regular_peak"), "DCPC", 1, id="critical_only"
+        ),
+        pytest.param(
+            ("past_critical_peak", "sample_critical_peak", "sample_regular_peak"),
+            "DCPC",
+            1,
+            id="future_only",
+        ),
+        pytest.param(("dpc_critical_peak",), "DPC", 1, id="dpc_critical"),
+    ],
+)
+async def test_sync_events_creates_future_critical_peaks(
+    request: pytest.FixtureRequest,
+    mock_hass: MagicMock,
+    peak_fixtures: tuple[str, ...],
+    rate: str,
+    expected_created: int,
 ) -> None:
-    """Test that sync only creates future events."""
-    # Create a past event
-    past_start = datetime.now(EST) - timedelta(days=1)
-    past_end = past_start + timedelta(hours=4)
-    past_data = {
-        "offre": "CPC-D",
-        "datedebut": past_start.isoformat(),
-        "datefin": past_end.isoformat(),
-        "plagehoraire": "AM",
-        "duree": "PT04H00MS",
-        "secteurclient": "Résidentiel",
-    }
-    past_peak = PeakEvent(past_data, preheat_duration=120, force_critical=True)
-
-    peaks = [past_peak, sample_critical_peak, sample_regular_peak]
+    """Test that sync only creates future critical peaks (past and non-critical are filtered)."""
+    peaks = [request.getfixturevalue(name) for name in peak_fixtures]
 
     new_uids = await calendar_manager.async_sync_events(
         mock_hass,
@@ -194,112 +263,129 @@ async def test_sync_events_creates_future_events_only(
         set(),
         "contract_123",
         "Home",
-        "DCPC",
+        rate,
     )
 
-    # Should create only 1 event (future critical one, non-critical and past filtered)
-    assert mock_hass.services.async_call.call_count == 1
-    assert len(new_uids) == 1
+    assert mock_hass.services.async_call.call_count == expected_created
+    assert len(new_uids) == expected_created
 
 
-@pytest.mark.asyncio
-async def test_sync_events_filters_by_criticality(
-    mock_hass: MagicMock, sample_critical_peak: PeakEvent, sample_regular_peak: PeakEvent
+async def test_sync_events_skips_existing(
+    mock_hass: MagicMock,
+    make_calendar_entity: Callable[..., MagicMock],
+    sample_critical_peak: PeakEvent,
 ) -> None:
-    """Test that sync only creates critical peaks (non-critical peaks are filtered out)."""
-    peaks = [sample_critical_peak, sample_regular_peak]
+    """Test that sync skips events that are already created."""
+    existing_uid = calendar_manager.generate_event_uid(
+        "contract_123", sample_critical_peak.start_date
+    )
+    stored_uids = {existing_uid}
+
+    # Mock calendar entity with existing critical event
+    mock_event = SimpleNamespace(
+        description=f"Test event\nCritique: Oui\nID: {existing_uid}\nOther data"
+    )
+
+    make_calendar_entity([mock_event])
 
-    # Only critical peaks
     new_uids = await calendar_manager.async_sync_events(
         mock_hass,
         "calendar.test",
-        peaks,
-        set(),
+        [sample_critical_peak],
+        stored_uids,
         "contract_123",
         "Home",
         "DCPC",
     )
 
-    # Should create only 1 event (critical one, non-critical filtered out)
-    assert mock_hass.services.async_call.call_count == 1
-    assert len(new_uids) == 1
+    # Should not create any events (already exists with same criticality)
+    assert mock_hass.services.async_call.call_count == 0
+    assert new_uids == stored_uids
 
 
-@pytest.mark.asyncio
-async def test_sync_events_skips_existing(
-    mock_hass: MagicMock, sample_critical_peak: PeakEvent
+async def test_sync_events_fast_path_all_known(
+    mock_hass: MagicMock,
+    mock_sleep: AsyncMock,
+    monkeypatch: pytest.MonkeyPatch,
+    make_calendar_entity: Callable[..., MagicMock],
+    sample_critical_peak: PeakEvent,
 ) -> None:
-    """Test that sync skips events that are already created."""
-    from homeassistant.components.calendar import CalendarEntity
+    """Test that sync returns early when every peak is already in the calendar."""
+    peaks = [sample_critical_peak, _peak(3, 16, critical=True, slot="PM")]
+    uids = {calendar_manager.generate_event_uid("contract_123", p.start_date) for p in peaks}
+    make_calendar_entity([SimpleNamespace(description=f"Critique: Oui\nID: {uid}") for uid in uids])
+    generate_event_uid = MagicMock(wraps=calendar_manager.generate_event_uid)
+    monkeypatch.setattr(calendar_manager, "generate_event_uid", generate_event_uid)
 
-    existing_uid = calendar_manager.generate_event_uid(
-        "contract_123", sample_critical_peak.start_date
+    new_uids = await calendar_manager.async_sync_events(
+        mock_hass,
+        "calendar.test",
+        peaks,
+        set(uids),
+        "contract_123",
+        "Home",
+        "DCPC",
     )
-    stored_uids = {existing_uid}
 
-    # Mock calendar entity with existing critical event
-    mock_event = MagicMock()
-    mock_event.description = f"Test event\nCritique: Oui\nID: {existing_uid}\nOther data"
+    assert new_uids == uids
+    mock_hass.services.async_call.assert_not_called()
+    mock_sleep.assert_not_called()
+    assert generate_event_uid.call_count == len(peaks)
 
-    mock_calendar_entity = MagicMock(spec=CalendarEntity)
-    mock_calendar_entity.entity_id = "calendar.test"
-    mock_calendar_entity.async_get_events = AsyncMock(return_value=[mock_event])
 
-    mock_calendar_component = MagicMock()
-    mock_calendar_component.entities = [mock_calendar_entity]
-    mock_hass.data = {"calendar": mock_calendar_component}
+async def test_sync_events_recreates_tracked_events_missing_from_calendar(
+    mock_hass: MagicMock, sample_critical_peak: PeakEvent
+) -> None:
+    """Test that a UID known only from storage is recreated after the calendar was cleared."""
+    uid = calendar_manager.generate_event_uid("contract_123", sample_critical_peak.start_date)
 
     new_uids = await calendar_manager.async_sync_events(
         mock_hass,
         "calendar.test",
         [sample_critical_peak],
-        stored_uids,
+        {uid},
         "contract_123",
         "Home",
         "DCPC",
     )
 
-    # Should not create any events (already exists with same criticality)
-    assert mock_hass.services.async_call.call_count == 0
-    assert new_uids == stored_uids
+    assert mock_hass.services.async_call.call_count == 1
+    assert new_uids == {uid}
 
 
-@pytest.mark.asyncio
-async def test_sync_events_sequential_with_delay(
-    mock_hass: MagicMock, sample_critical_peak: PeakEvent, sample_regular_peak: PeakEvent
+async def test_sync_events_generates_each_uid_once(
+    mock_hass: MagicMock, monkeypatch: pytest.MonkeyPatch, sample_critical_peak: PeakEvent
 ) -> None:
-    """Test that events are created sequentially with delay."""
-    peaks = [sample_critical_peak, sample_regular_peak]
+    """Test that sync builds each peak's UID once, including for the events it creates."""
+    peaks = [sample_critical_peak, _peak(3, 16, critical=True, slot="PM")]
+    generate_event_uid = MagicMock(wraps=calendar_manager.generate_event_uid)
+    monkeypatch.setattr(calendar_manager, "generate_event_uid", generate_event_uid)
 
-    with patch("custom_components.hydroqc.calendar_manager.asyncio.sleep") as mock_sleep:
-        await calendar_manager.async_sync_events(
-            mock_hass,
-            "calendar.test",
-            peaks,
-            set(),
-            "contract_123",
-            "Home",
-            "DCPC",
-        )
+    new_uids = await calendar_manager.async_sync_events(
+        mock_hass,
+        "calendar.test",
+        peaks,
+        set(),
+        "contract_123",
+        "Home",
+        "DCPC",
+    )
 
-        # Should not sleep (only one critical event created)
-        mock_sleep.assert_not_called()
+    assert mock_hass.services.async_call.call_count == 2
+    assert len(new_uids) == 2
+    assert generate_event_uid.call_count == len(peaks)
 
 
-@pytest.mark.asyncio
-async def test_sync_events_continues_on_individual_failure(
-    mock_hass: MagicMock, sample_critical_peak: PeakEvent, sample_regular_peak: PeakEvent
+async def test_sync_events_sequential_with_delay(
+    mock_hass: MagicMock,
+    mock_sleep: AsyncMock,
+    sample_critical_peak: PeakEvent,
+    sample_regular_peak: PeakEvent,
 ) -> None:
-    """Test that sync continues creating events even if one fails."""
-    # Make first create fail, second create succeed
-    mock_hass.services.async_call.side_effect = [
-        Exception("First event failed"),
-        None,  # second create succeeds
-    ]
-
+    """Test that events are created sequentially with delay."""
     peaks = [sample_critical_peak, sample_regular_peak]
 
-    new_uids = await calendar_manager.async_sync_events(
+    await calendar_manager.async_sync_events(
         mock_hass,
         "calendar.test",
         peaks,
@@ -309,34 +395,40 @@ async def test_sync_events_continues_on_individual_failure(
         "DCPC",
     )
 
-    # Should attempt to create only 1 event (critical one)
-    assert mock_hass.services.async_call.call_count == 1
-    # Non-critical peaks are filtered, so no attempts for them
-    assert len(new_uids) == 0  # The one attempt failed
+    # Should not sleep (only one critical event created)
+    mock_sleep.assert_not_called()
 
 
-@pytest.mark.asyncio
-async def test_sync_events_empty_list(mock_hass: MagicMock) -> None:
-    """Test syncing with empty peak list."""
-    new_uids = await calendar_manager.async_sync_events(
+async def test_sync_events_delays_between_creations(
+    mock_hass: MagicMock, mock_sleep: AsyncMock, sample_critical_peak: PeakEvent
+) -> None:
+    """Test that sync waits between consecutive event creations, but not after the last."""
+    peaks = [sample_critical_peak, _peak(3, 16, critical=True, slot="PM")]
+
+    await calendar_manager.async_sync_events(
         mock_hass,
         "calendar.test",
-        [],
+        peaks,
         set(),
         "contract_123",
         "Home",
         "DCPC",
     )
 
-    mock_hass.services.async_call.assert_not_called()
-    assert len(new_uids) == 0
+    assert mock_hass.services.async_call.call_count == 2
+    mock_sleep.assert_awaited_once_with(calendar_manager.EVENT_CREATION_DELAY)
 
 
-@pytest.mark.asyncio
-async def test_sync_events_includes_all_when_flag_true(
+async def test_sync_events_continues_on_individual_failure(
     mock_hass: MagicMock, sample_critical_peak: PeakEvent, sample_regular_peak: PeakEvent
 ) -> None:
-    """Test that only critical events are created (non-critical events are always filtered)."""
+    """Test that sync continues creating events even if one fails."""
+    # Make first create fail, second create succeed
+    mock_hass.services.async_call.side_effect = [
+        _SERVICE_FAIL,
+        None,  # second create succeeds
+    ]
+
     peaks = [sample_critical_peak, sample_regular_peak]
 
     new_uids = await calendar_manager.async_sync_events(
@@ -349,11 +441,10 @@ async def test_sync_events_includes_all_when_flag_true(
         "DCPC",
     )
 
-    # Should create only 1 event (critical only, non-critical filtered)
+    # Should attempt to create only 1 event (critical one)
     assert mock_hass.services.async_call.call_count == 1
-    assert len(new_uids) == 1
-
-
+    # Non-critical peaks are filtered, so no attempts for them
+    assert len(new_uids) == 0  # The one attempt failed
 
 
 def test_event_description_template() -> None:
@@ -377,7 +468,6 @@ def test_event_description_template() -> None:
     assert f"ID: {uid}" in description
 
 
-@pytest.mark.asyncio
 async def test_get_existing_event_uids_no_calendar_component(mock_hass: MagicMock) -> None:
     """Test getting existing UIDs when calendar component is not loaded."""
     mock_hass.data = {}  # No calendar component
@@ -393,7 +483,6 @@ async def test_get_existing_event_uids_no_calendar_component(mock_hass: MagicMoc
     assert isinstance(events_info, dict)
 
 
-@pytest.mark.asyncio
 async def test_get_existing_event_uids_no_matching_entity(mock_hass: MagicMock) -> None:
     """Test getting existing UIDs when calendar entity doesn't exist."""
     # Mock calendar component but no matching entity
@@ -412,34 +501,27 @@ async def test_get_existing_event_uids_no_matching_entity(mock_hass: MagicMock)
     assert isinstance(events_info, dict)
 
 
-@pytest.mark.asyncio
-async def test_get_existing_event_uids_finds_hydroqc_events(mock_hass: MagicMock) -> None:
+async def test_get_existing_event_uids_finds_hydroqc_events(
+    mock_hass: MagicMock, make_calendar_entity: Callable[..., MagicMock]
+) -> None:
     """Test extracting UIDs from calendar event descriptions."""
-    from homeassistant.components.calendar import CalendarEntity
-
     # Mock calendar entity with events (one critical, one non-critical)
-    mock_event1 = MagicMock()
-    mock_event1.description = (
-        "Test event\nCritique: Oui\nID: hydroqc_contract_123_2025-01-15T06:00:00-05:00\nOther data"
+    mock_event1 = SimpleNamespace(
+        description=(
+            "Test event\nCritique: Oui\n"
+            "ID: hydroqc_contract_123_2025-01-15T06:00:00-05:00\nOther data"
+        )
     )
 
-    mock_event2 = MagicMock()
-    mock_event2.description = (
-        "Another event\nCritique: Non\nID: hydroqc_contract_123_2025-01-15T16:00:00-05:00"
+    mock_event2 = SimpleNamespace(
+        description=(
+            "Another event\nCritique: Non\nID: hydroqc_contract_123_2025-01-15T16:00:00-05:00"
+        )
     )
 
-    mock_event3 = MagicMock()
-    mock_event3.description = "Event without UID"  # Should be ignored
-
-    mock_calendar_entity = MagicMock(spec=CalendarEntity)
-    mock_calendar_entity.entity_id = "calendar.test"
-    mock_calendar_entity.async_get_events = AsyncMock(
-        return_value=[mock_event1, mock_event2, mock_event3]
-    )
+    mock_event3 = SimpleNamespace(description="Event without UID")  # Should be ignored
 
-    mock_calendar_component = MagicMock()
-    mock_calendar_component.entities = [mock_calendar_entity]
-    mock_hass.data = {"calendar": mock_calendar_component}
+    make_calendar_entity([mock_event1, mock_event2, mock_event3])
 
     start_date = datetime.now(EST)
     end_date = start_date + timedelta(days=7)
@@ -457,18 +539,35 @@ async def test_get_existing_event_uids_finds_hydroqc_events(mock_hass: MagicMock
     assert events_info["hydroqc_contract_123_2025-01-15T16:00:00-05:00"] is False
 
 
-@pytest.mark.asyncio
-async def test_get_existing_event_uids_handles_errors(mock_hass: MagicMock) -> None:
-    """Test that errors querying calendar are handled gracefully."""
-    from homeassistant.components.calendar import CalendarEntity
+async def test_get_existing_event_uids_bulk(
+    mock_hass: MagicMock, make_calendar_entity: Callable[..., MagicMock]
+) -> None:
+    """Test extracting UIDs from a large calendar, ignoring foreign events."""
+    start_date = datetime.now(EST)
+    uids = [
+        calendar_manager.generate_event_uid("contract_123", start_date + timedelta(hours=hour))
+        for hour in range(10_000)
+    ]
+    events = [
+        SimpleNamespace(description=f"Pointe\nCritique: {'Oui' if i % 2 else 'Non'}\nID: {uid}")
+        for i, uid in enumerate(uids)
+    ]
+    events.append(SimpleNamespace(description="ID: other_calendar_event"))
+    events.append(SimpleNamespace(description=None))
+    make_calendar_entity(events)
+
+    events_info = await calendar_manager.async_get_existing_event_uids(
+        mock_hass, "calendar.test", start_date, start_date + timedelta(days=7)
+    )
 
-    mock_calendar_entity = MagicMock(spec=CalendarEntity)
-    mock_calendar_entity.entity_id = "calendar.test"
-    mock_calendar_entity.async_get_events = AsyncMock(side_effect=Exception("Calendar error"))
+    assert events_info == {uid: bool(i % 2) for i, uid in enumerate(uids)}
 
-    mock_calendar_component = MagicMock()
-    mock_calendar_component.entities = [mock_calendar_entity]
-    mock_hass.data = {"calendar": mock_calendar_component}
+
+async def test_get_existing_event_uids_handles_errors(
+    mock_hass: MagicMock, make_calendar_entity: Callable[..., MagicMock]
+) -> None:
+    """Test that errors querying calendar are handled gracefully."""
+    make_calendar_entity(error=Exception("Calendar error"))
 
     start_date = datetime.now(EST)
     end_date = start_date + timedelta(days=7)
@@ -482,66 +581,14 @@ async def test_get_existing_event_uids_handles_errors(mock_hass: MagicMock) -> N
     assert isinstance(events_info, dict)
 
 
-@pytest.mark.asyncio
-async def test_sync_events_dpc_only_critical(
-    mock_hass: MagicMock,
-) -> None:
-    """Test DPC rate only creates events for critical peaks."""
-    # Create DPC peaks (all from API, all critical)
-    dpc_peak1 = PeakEvent(
-        {
-            "offre": "TPC-DPC",
-            "datedebut": (datetime.now(EST) + timedelta(days=1))
-            .replace(hour=14, minute=0)
-            .isoformat(),
-            "datefin": (datetime.now(EST) + timedelta(days=1))
-            .replace(hour=18, minute=0)
-            .isoformat(),
-            "plagehoraire": "PM",
-            "duree": "PT04H00MS",
-            "secteurclient": "Résidentiel",
-        },
-        preheat_duration=120,
-        force_critical=True,  # All DPC API events are critical
-    )
-
-    peaks = [dpc_peak1]
-
-    new_uids = await calendar_manager.async_sync_events(
-        mock_hass,
-        "calendar.test",
-        peaks,
-        set(),
-        "contract_dpc",
-        "Home",
-        "DPC",  # Default setting
-    )
-
-    # Should create 1 event (critical DPC peak)
-    assert mock_hass.services.async_call.call_count == 1
-    assert len(new_uids) == 1
-
-
-@pytest.mark.asyncio
 async def test_sync_events_merges_stored_and_calendar_uids(
-    mock_hass: MagicMock, sample_critical_peak: PeakEvent
+    mock_hass: MagicMock,
+    make_calendar_entity: Callable[..., MagicMock],
+    sample_critical_peak: PeakEvent,
 ) -> None:
     """Test that sync merges UIDs from storage and calendar to avoid duplicates."""
-    from homeassistant.components.calendar import CalendarEntity
-
     # Create a second peak
-    peak2_start = datetime.now(EST) + timedelta(days=3)
-    peak2_start = peak2_start.replace(hour=16, minute=0, second=0, microsecond=0)
-    peak2_end = peak2_start + timedelta(hours=4)
-    peak2_data = {
-        "offre": "CPC-D",
-        "datedebut": peak2_start.isoformat(),
-        "datefin": peak2_end.isoformat(),
-        "plagehoraire": "PM",
-        "duree": "PT04H00MS",
-        "secteurclient": "Résidentiel",
-    }
-    peak2 = PeakEvent(peak2_data, preheat_duration=120, force_critical=True)
+    peak2 = _peak(3, 16, critical=True, slot="PM")
 
     # UID for first peak is in storage
     uid1 = calendar_manager.generate_event_uid("contract_123", sample_critical_peak.start_date)
@@ -551,19 +598,13 @@ async def test_sync_events_merges_stored_and_calendar_uids(
     uid2 = calendar_manager.generate_event_uid("contract_123", peak2.start_date)
 
     # Mock calendar entity with BOTH events (critical, matching peaks)
-    mock_event1 = MagicMock()
-    mock_event1.description = f"First event\nCritique: Oui\nID: {uid1}\nOther data"
-
-    mock_event2 = MagicMock()
-    mock_event2.description = f"Second event\nCritique: Oui\nID: {uid2}\nOther data"
+    mock_event1 = SimpleNamespace(description=f"First event\nCritique: Oui\nID: {uid1}\nOther data")
 
-    mock_calendar_entity = MagicMock(spec=CalendarEntity)
-    mock_calendar_entity.entity_id = "calendar.test"
-    mock_calendar_entity.async_get_events = AsyncMock(return_value=[mock_event1, mock_event2])
+    mock_event2 = SimpleNamespace(
+        description=f"Second event\nCritique: Oui\nID: {uid2}\nOther data"
+    )
 
-    mock_calendar_component = MagicMock()
-    mock_calendar_component.entities = [mock_calendar_entity]
-    mock_hass.data = {"calendar": mock_calendar_component}
+    make_calendar_entity([mock_event1, mock_event2])
 
     peaks = [sample_critical_peak, peak2]
 
@@ -585,27 +626,13 @@ async def test_sync_events_merges_stored_and_calendar_uids(
     assert uid2 in new_uids
 
 
-@pytest.mark.asyncio
 async def test_sync_events_different_contracts_same_calendar(
     mock_hass: MagicMock,
 ) -> None:
     """Test multiple contracts can share the same calendar with unique UIDs."""
     # Create peaks for two different contracts at same time
-    start = datetime.now(EST) + timedelta(days=1)
-    start = start.replace(hour=6, minute=0, second=0, microsecond=0)
-    end = start + timedelta(hours=4)
-
-    peak_data = {
-        "offre": "CPC-D",
-        "datedebut": start.isoformat(),
-        "datefin": end.isoformat(),
-        "plagehoraire": "AM",
-        "duree": "PT04H00MS",
-        "secteurclient": "Résidentiel",
-    }
-
-    peak1 = PeakEvent(peak_data, preheat_duration=120, force_critical=True)
-    peak2 = PeakEvent(peak_data, preheat_duration=120, force_critical=True)
+    peak1 = _peak(1, 6, critical=True)
+    peak2 = _peak(1, 6, critical=True)
 
     # First contract syncs
     uids1 = await calendar_manager.async_sync_events(
@@ -0,0 +1,53 @@
+"""Unit tests for public_data models."""
+
+import datetime
+
+import pytest
+
+from custom_components.hydroqc.public_data import models
+from custom_components.hydroqc.public_data.models import PeakEvent
+from custom_components.hydroqc.utils import TZ as EST
+
+# Same evening peak as pre-built datetimes (generated schedule)
+_PEAK_START = datetime.datetime(2025, 1, 15, 16, tzinfo=EST)
+_PEAK_END = datetime.datetime(2025, 1, 15, 20, tzinfo=EST)
+
+
+class TestPeakEventDates:
+    """Test PeakEvent date parsing."""
+
+    @pytest.mark.parametrize(
+        ("start", "end"),
+        [
+            pytest.param("2025-01-15 16:00", "2025-01-15 20:00", id="simple"),
+            pytest.param("2025-01-15T16:00:00-05:00", "2025-01-15T20:00:00-05:00", id="iso"),
+            pytest.param(_PEAK_START, _PEAK_END, id="datetime"),
+        ],
+    )
+    def test_dates_match_across_api_forms(
+        self, start: str | datetime.datetime, end: str | datetime.datetime
+    ) -> None:
+        """Test API strings and pre-built datetimes give the same aware dates."""
+        event = PeakEvent({"offre": "CPC-D", "datedebut": start, "datefin": end})
+
+        assert event.start_date == _PEAK_START
+        assert event.end_date == _PEAK_END
+        assert event.start_date.utcoffset() == datetime.timedelta(hours=-5)
+
+    def test_parse_iso_skips_cache_for_long_strings(self) -> None:
+        """Test strings past the length guard are parsed without filling the cache."""
+        long_value = "2025-01-15T16:00:00.000000-05:00:00.000000"
+        assert len(long_value) >= models._ISO_CACHE_MAX_LEN
+
+        cache_size = models._cached_fromisoformat.cache_info().currsize
+        assert models._parse_iso(long_value) == _PEAK_START
+        assert models._cached_fromisoformat.cache_info().currsize == cache_size
+
+    def test_parse_iso_caches_api_sized_strings(self) -> None:
+        """Test API-sized strings are served from the cache on repeat."""
+        value = "2025-01-15T16:00:00-05:00"
+        models._parse_iso(value)
+
+        hits = models._cached_fromisoformat.cache_info().hits
+        assert models._parse_iso(value) == _PEAK_START
+        assert models._cached_fromisoformat.cache_info().hits == hits + 1
@@ -1,359 +1,159 @@
 """Unit tests for sensor entities."""
 
-from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, patch
-from zoneinfo import ZoneInfo
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from homeassistant.core import HomeAssistant
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.hydroqc.const import DOMAIN
-from custom_components.hydroqc.coordinator import HydroQcDataCoordinator
-from custom_components.hydroqc.sensor import async_setup_entry
+from custom_components.hydroqc.coordinator import HydroQcDataCoordinator, base as coordinator_base
+from custom_components.hydroqc.sensor import HydroQcSensor, async_setup_entry
 
-EST_TIMEZONE = ZoneInfo("America/Toronto")
 
+@pytest.fixture(autouse=True)
+def patch_clients(
+    monkeypatch: pytest.MonkeyPatch, mock_webuser: MagicMock, mock_public_client: MagicMock
+) -> None:
+    """Make every coordinator build the mock WebUser and PublicDataClient."""
+    monkeypatch.setattr(coordinator_base, "WebUser", MagicMock(return_value=mock_webuser))
+    monkeypatch.setattr(
+        coordinator_base, "PublicDataClient", MagicMock(return_value=mock_public_client)
+    )
 
-@pytest.mark.asyncio
-class TestHydroQcSensor:
-    """Test the HydroQcSensor entities."""
 
-    async def test_sensor_setup_rate_d(
-        self,
-        hass: HomeAssistant,
-        mock_config_entry: MockConfigEntry,
-        mock_webuser: MagicMock,
-        mock_contract: MagicMock,
-        mock_integration_version: MagicMock,
-    ) -> None:
-        """Test sensor setup for Rate D contract."""
-        mock_config_entry.add_to_hass(hass)
-        mock_webuser.customers[0].accounts[0].contracts[0] = mock_contract
+@pytest.fixture
+async def sensor_entities(
+    hass: HomeAssistant,
+    config_entry_variant: MockConfigEntry,
+    mock_webuser: MagicMock,
+    portal_contract: MagicMock,
+    mock_integration_version: AsyncMock,
+) -> list[HydroQcSensor]:
+    """Return the sensors set up for a coordinator built against the mock clients.
 
-        with (
-            patch(
-                "custom_components.hydroqc.coordinator.WebUser",
-                return_value=mock_webuser,
-            ),
-            patch("custom_components.hydroqc.coordinator.base.PublicDataClient"),
-        ):
-            coordinator = HydroQcDataCoordinator(hass, mock_config_entry)
-            await coordinator.async_refresh()
+    Setup only reads the config entry, so the coordinator has not fetched any data.
+    """
+    mock_webuser.customers[0].accounts[0].contracts[0] = portal_contract
 
-            # Register coordinator in hass.data like real integration does
-            hass.data.setdefault(DOMAIN, {})
-            hass.data[DOMAIN][mock_config_entry.entry_id] = coordinator
+    coordinator = HydroQcDataCoordinator(hass, config_entry_variant)
 
-            async_add_entities = MagicMock()
-            await async_setup_entry(hass, mock_config_entry, async_add_entities)
+    # Register coordinator in hass.data like real integration does
+    hass.data.setdefault(DOMAIN, {})[config_entry_variant.entry_id] = coordinator
 
-            # Verify sensors were created
-            assert async_add_entities.called
-            entities = async_add_entities.call_args[0][0]
+    async_add_entities = MagicMock()
+    await async_setup_entry(hass, config_entry_variant, async_add_entities)
+    return async_add_entities.call_args[0][0]
 
-            # Rate D should have basic sensors (balance, billing period, etc.)
-            # Should NOT have winter credit sensors or peak sensors
-            sensor_keys = [entity._sensor_key for entity in entities]
-            assert "balance" in sensor_keys
-            assert "current_billing_period_projected_bill" in sensor_keys
-            assert "current_billing_period_total_consumption" in sensor_keys
 
-            # Winter credit sensors should not be present for Rate D
-            assert "wc_cumulated_credit" not in sensor_keys
-            assert "dpc_current_state" not in sensor_keys
+@pytest.fixture
+async def updated_sensor_entities(sensor_entities: list[HydroQcSensor]) -> list[HydroQcSensor]:
+    """Return sensor_entities after one coordinator data update."""
+    coordinator = sensor_entities[0].coordinator
+    # Only the fetched data matters to the sensors: skip the refresh machinery
+    coordinator.data = await coordinator._async_update_data()
+    return sensor_entities
 
-    async def test_sensor_setup_rate_dcpc(
-        self,
-        hass: HomeAssistant,
-        mock_config_entry: MockConfigEntry,
-        mock_webuser: MagicMock,
-        mock_contract_dcpc: MagicMock,
-        mock_integration_version: MagicMock,
-    ) -> None:
-        """Test sensor setup for Rate D+CPC contract (winter credits)."""
-        # Update config to use CPC rate option
-        dcpc_config = MockConfigEntry(
-            domain=DOMAIN,
-            data={**mock_config_entry.data, "rate": "D", "rate_option": "CPC"},
-            entry_id=mock_config_entry.entry_id,
-            unique_id=mock_config_entry.unique_id,
-        )
-        dcpc_config.add_to_hass(hass)
-        mock_webuser.customers[0].accounts[0].contracts[0] = mock_contract_dcpc
-
-        with (
-            patch(
-                "custom_components.hydroqc.coordinator.WebUser",
-                return_value=mock_webuser,
-            ),
-            patch("custom_components.hydroqc.coordinator.base.PublicDataClient"),
-        ):
-            coordinator = HydroQcDataCoordinator(hass, dcpc_config)
-            await coordinator.async_refresh()
 
-            # Register coordinator in hass.data like real integration does
-            hass.data.setdefault(DOMAIN, {})
-            hass.data[DOMAIN][dcpc_config.entry_id] = coordinator
-
-            async_add_entities = MagicMock()
-            await async_setup_entry(hass, dcpc_config, async_add_entities)
-
-            entities = async_add_entities.call_args[0][0]
-            sensor_keys = [entity._sensor_key for entity in entities]
-
-            # Should have winter credit sensors
-            assert "wc_cumulated_credit" in sensor_keys
-            assert "wc_yesterday_morning_peak_credit" in sensor_keys
-            assert "wc_yesterday_evening_peak_credit" in sensor_keys
+class TestHydroQcSensor:
+    """Test the HydroQcSensor entities."""
 
-    async def test_sensor_setup_rate_dpc(
+    @pytest.mark.parametrize(
+        ("config_entry_variant", "portal_contract", "expected_present", "expected_absent"),
+        [
+            # Rate D has basic sensors, no winter credit or peak sensors
+            pytest.param(
+                None,
+                "mock_contract",
+                {
+                    "balance",
+                    "current_billing_period_projected_bill",
+                    "current_billing_period_total_consumption",
+                },
+                {"wc_cumulated_credit", "dpc_current_state"},
+                id="rate_d",
+            ),
+            # Rate D+CPC (winter credits) adds the winter credit sensors
+            pytest.param(
+                "dcpc",
+                "mock_contract_dcpc",
+                {
+                    "wc_cumulated_credit",
+                    "wc_yesterday_morning_peak_credit",
+                    "wc_yesterday_evening_peak_credit",
+                },
+                set(),
+                id="rate_dcpc",
+            ),
+            # Flex-D without calendar keeps portal sensors but no calendar-based ones
+            pytest.param(
+                "dpc",
+                "mock_contract_dpc",
+                {"dpc_critical_hours_count"},
+                {"dpc_state", "dpc_next_peak_start"},
+                id="rate_dpc",
+            ),
+        ],
+        indirect=["config_entry_variant", "portal_contract"],
+    )
+    async def test_sensor_setup_for_rate(
         self,
-        hass: HomeAssistant,
-        mock_config_entry: MockConfigEntry,
-        mock_webuser: MagicMock,
-        mock_contract_dpc: MagicMock,
-        mock_integration_version: MagicMock,
+        sensor_entities: list[HydroQcSensor],
+        expected_present: set[str],
+        expected_absent: set[str],
     ) -> None:
-        """Test sensor setup for Flex-D (DPC) contract without calendar.
-
-        Without a calendar configured, calendar-based sensors should NOT be created.
-        """
-        # Update config to use DPC rate (no calendar)
-        dpc_config = MockConfigEntry(
-            domain=DOMAIN,
-            data={**mock_config_entry.data, "rate": "DPC"},
-            entry_id=mock_config_entry.entry_id,
-            unique_id=mock_config_entry.unique_id,
-        )
-        dpc_config.add_to_hass(hass)
-        mock_webuser.customers[0].accounts[0].contracts[0] = mock_contract_dpc
-
-        with (
-            patch(
-                "custom_components.hydroqc.coordinator.WebUser",
-                return_value=mock_webuser,
-            ),
-            patch("custom_components.hydroqc.coordinator.base.PublicDataClient"),
-        ):
-            coordinator = HydroQcDataCoordinator(hass, dpc_config)
-            await coordinator.async_refresh()
+        """Test sensor setup creates only the sensors that apply to the contract rate."""
+        sensor_keys = {entity._sensor_key for entity in sensor_entities}
 
-            # Register coordinator in hass.data like real integration does
-            hass.data.setdefault(DOMAIN, {})
-            hass.data[DOMAIN][dpc_config.entry_id] = coordinator
-
-            async_add_entities = MagicMock()
-            await async_setup_entry(hass, dpc_config, async_add_entities)
-
-            entities = async_add_entities.call_args[0][0]
-            sensor_keys = [entity._sensor_key for entity in entities]
-
-            # Calendar-based Flex-D sensors should NOT be created without calendar
-            assert "dpc_state" not in sensor_keys
-            assert "dpc_next_peak_start" not in sensor_keys
-            # Portal-based sensors should still be created
-            assert "dpc_critical_hours_count" in sensor_keys
+        # Set differences so a failure names the offending keys
+        assert expected_present - sensor_keys == set()
+        assert expected_absent & sensor_keys == set()
 
     async def test_sensor_state_value(
-        self,
-        hass: HomeAssistant,
-        mock_config_entry: MockConfigEntry,
-        mock_webuser: MagicMock,
-        mock_contract: MagicMock,
-        mock_integration_version: MagicMock,
-        mock_public_client: MagicMock,
+        self, updated_sensor_entities: list[HydroQcSensor], mock_contract: MagicMock
     ) -> None:
         """Test sensor returns correct state value."""
-        mock_config_entry.add_to_hass(hass)
-        mock_webuser.customers[0].accounts[0].contracts[0] = mock_contract
-        mock_webuser.check_hq_portal_status = AsyncMock(return_value=True)
         # Set the projected bill value on mock contract
         mock_contract.cp_projected_bill = 75.00
 
-        with (
-            patch(
-                "custom_components.hydroqc.coordinator.base.WebUser",
-                return_value=mock_webuser,
-            ),
-            patch("custom_components.hydroqc.coordinator.base.PublicDataClient", return_value=mock_public_client),
-        ):
-            coordinator = HydroQcDataCoordinator(hass, mock_config_entry)
-            coordinator._first_refresh_done = False
-            await coordinator.async_refresh()
-
-            # Register coordinator in hass.data like real integration does
-            hass.data.setdefault(DOMAIN, {})
-            hass.data[DOMAIN][mock_config_entry.entry_id] = coordinator
-
-            async_add_entities = MagicMock()
-            await async_setup_entry(hass, mock_config_entry, async_add_entities)
-
-            entities = async_add_entities.call_args[0][0]
+        # Find the projected bill sensor
+        entities_by_key = {entity._sensor_key: entity for entity in updated_sensor_entities}
+        projected_bill_sensor = entities_by_key["current_billing_period_projected_bill"]
 
-            # Find the projected bill sensor
-            projected_bill_sensor = next(
-                (e for e in entities if e._sensor_key == "current_billing_period_projected_bill"),
-                None,
-            )
-            assert projected_bill_sensor is not None
-
-            # Verify it returns the correct value from coordinator
-            assert projected_bill_sensor.native_value == 75.00
+        # Verify it returns the correct value from coordinator
+        assert projected_bill_sensor.native_value == 75.00
 
-    async def test_sensor_attributes(
-        self,
-        hass: HomeAssistant,
-        mock_config_entry: MockConfigEntry,
-        mock_webuser: MagicMock,
-        mock_contract: MagicMock,
-        mock_integration_version: MagicMock,
-        mock_public_client: MagicMock,
-    ) -> None:
+    async def test_sensor_attributes(self, updated_sensor_entities: list[HydroQcSensor]) -> None:
         """Test sensor includes correct attributes."""
-        mock_config_entry.add_to_hass(hass)
-        mock_webuser.customers[0].accounts[0].contracts[0] = mock_contract
-        mock_webuser.check_hq_portal_status = AsyncMock(return_value=True)
-
-        with (
-            patch(
-                "custom_components.hydroqc.coordinator.base.WebUser",
-                return_value=mock_webuser,
-            ),
-            patch("custom_components.hydroqc.coordinator.base.PublicDataClient", return_value=mock_public_client),
-        ):
-            coordinator = HydroQcDataCoordinator(hass, mock_config_entry)
-            coordinator._first_refresh_done = False
-            await coordinator.async_refresh()
-
-            # Register coordinator in hass.data like real integration does
-            hass.data.setdefault(DOMAIN, {})
-            hass.data[DOMAIN][mock_config_entry.entry_id] = coordinator
-
-            async_add_entities = MagicMock()
-            await async_setup_entry(hass, mock_config_entry, async_add_entities)
-
-            entities = async_add_entities.call_args[0][0]
-
-            # Check that sensors have required attributes
-            for entity in entities:
-                extra_state_attributes = entity.extra_state_attributes
-                assert "last_update" in extra_state_attributes
-                assert "data_source" in extra_state_attributes
-
-                # Verify last_update is an ISO timestamp
-                last_update = extra_state_attributes["last_update"]
-                assert isinstance(last_update, str)
-                # Should be parseable as datetime
-                datetime.fromisoformat(last_update.replace("Z", "+00:00"))
-
-    async def test_sensor_availability(
-        self,
-        hass: HomeAssistant,
-        mock_config_entry: MockConfigEntry,
-        mock_webuser: MagicMock,
-        mock_contract: MagicMock,
-        mock_integration_version: MagicMock,
-    ) -> None:
+        # All sensors report the coordinator's last successful update time
+        update_time = updated_sensor_entities[0].coordinator.last_update_success_time
+        assert update_time is not None
+        expected_last_update = update_time.isoformat()
+
+        # Check that sensors have required attributes
+        for entity in updated_sensor_entities:
+            extra_state_attributes = entity.extra_state_attributes
+            assert extra_state_attributes["last_update"] == expected_last_update
+            assert "data_source" in extra_state_attributes
+
+    async def test_sensor_availability(self, updated_sensor_entities: list[HydroQcSensor]) -> None:
         """Test sensor availability based on data presence."""
-        mock_config_entry.add_to_hass(hass)
-        mock_webuser.customers[0].accounts[0].contracts[0] = mock_contract
-
-        with (
-            patch(
-                "custom_components.hydroqc.coordinator.WebUser",
-                return_value=mock_webuser,
-            ),
-            patch("custom_components.hydroqc.coordinator.base.PublicDataClient"),
-        ):
-            coordinator = HydroQcDataCoordinator(hass, mock_config_entry)
-            await coordinator.async_refresh()
-
-            # Register coordinator in hass.data like real integration does
-            hass.data.setdefault(DOMAIN, {})
-            hass.data[DOMAIN][mock_config_entry.entry_id] = coordinator
-
-            async_add_entities = MagicMock()
-            await async_setup_entry(hass, mock_config_entry, async_add_entities)
-
-            entities = async_add_entities.call_args[0][0]
-
-            # All sensors should be available with valid data
-            for entity in entities:
-                assert entity.available
+        # All sensors should be available with valid data
+        for entity in updated_sensor_entities:
+            assert entity.available
 
-    async def test_sensor_device_info(
-        self,
-        hass: HomeAssistant,
-        mock_config_entry: MockConfigEntry,
-        mock_webuser: MagicMock,
-        mock_contract: MagicMock,
-        mock_integration_version: MagicMock,
-    ) -> None:
+    async def test_sensor_device_info(self, sensor_entities: list[HydroQcSensor]) -> None:
         """Test sensor device info is correctly set."""
-        mock_config_entry.add_to_hass(hass)
-        mock_webuser.customers[0].accounts[0].contracts[0] = mock_contract
-
-        with (
-            patch(
-                "custom_components.hydroqc.coordinator.WebUser",
-                return_value=mock_webuser,
-            ),
-            patch("custom_components.hydroqc.coordinator.base.PublicDataClient"),
-        ):
-            coordinator = HydroQcDataCoordinator(hass, mock_config_entry)
-            await coordinator.async_refresh()
-
-            # Register coordinator in hass.data like real integration does
-            hass.data.setdefault(DOMAIN, {})
-            hass.data[DOMAIN][mock_config_entry.entry_id] = coordinator
-
-            async_add_entities = MagicMock()
-            await async_setup_entry(hass, mock_config_entry, async_add_entities)
-
-            entities = async_add_entities.call_args[0][0]
-
-            # Check device info
-            for entity in entities:
-                device_info = entity.device_info
-                assert device_info is not None
-                assert "identifiers" in device_info
-                assert "name" in device_info
-                assert "manufacturer" in device_info
+        # Check device info
+        for entity in sensor_entities:
+            device_info = entity.device_info
+            assert device_info is not None
+            assert {"identifiers", "name", "manufacturer"} <= device_info.keys()
 
-    async def test_sensor_unique_id(
-        self,
-        hass: HomeAssistant,
-        mock_config_entry: MockConfigEntry,
-        mock_webuser: MagicMock,
-        mock_contract: MagicMock,
-        mock_integration_version: MagicMock,
-    ) -> None:
+    async def test_sensor_unique_id(self, sensor_entities: list[HydroQcSensor]) -> None:
         """Test sensor unique IDs are correctly formatted."""
-        mock_config_entry.add_to_hass(hass)
-        mock_webuser.customers[0].accounts[0].contracts[0] = mock_contract
-
-        with (
-            patch(
-                "custom_components.hydroqc.coordinator.WebUser",
-                return_value=mock_webuser,
-            ),
-            patch("custom_components.hydroqc.coordinator.base.PublicDataClient"),
-        ):
-            coordinator = HydroQcDataCoordinator(hass, mock_config_entry)
-            await coordinator.async_refresh()
-
-            # Register coordinator in hass.data like real integration does
-            hass.data.setdefault(DOMAIN, {})
-            hass.data[DOMAIN][mock_config_entry.entry_id] = coordinator
-
-            async_add_entities = MagicMock()
-            await async_setup_entry(hass, mock_config_entry, async_add_entities)
-
-            entities = async_add_entities.call_args[0][0]
-
         # Verify unique IDs are set and contain contract ID
-        unique_ids = [entity.unique_id for entity in entities]
+        unique_ids = [entity.unique_id for entity in sensor_entities]
         assert len(unique_ids) == len(set(unique_ids))  # All unique
         for uid in unique_ids:
-            assert "contract123" in uid
\ No newline at end of file
+            assert "contract123" in uid